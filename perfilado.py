@@ -0,0 +1,187 @@
+"""
+Perfilado opcional compartido por las simulaciones.
+
+Se activa con la variable de entorno PERFILADO o con el argumento --perfil:
+
+    PERFILADO=1 python juego_persecucion.py              # tiempos por fase
+    PERFILADO=tiempos,cprofile,memoria python ...         # además cProfile y tracemalloc
+    python sensor_interactivo.py 2000 --perfil=cprofile
+
+Cada script marca sus fases (entrada, actualización, registro, dibujo...) con
+`with perfil.fase("nombre"):`. Los tiempos se guardan en un histograma logarítmico
+de tamaño fijo, y al salir se imprime un resumen en stderr. Si el perfilado está
+desactivado, `fase` devuelve un contexto vacío, así el costo es prácticamente nulo.
+
+Los scripts empiezan con `perfil = perfilado.INACTIVO` (importarlos no mide nada ni
+toca sys.argv) y su punto de entrada lo reemplaza con `perfilado.crear("nombre")`.
+"""
+import atexit
+import os
+import sys
+import time
+from contextlib import nullcontext
+
+NUM_CUBETAS = 32  # La cubeta k guarda duraciones en [2^(k-1), 2^k) microsegundos
+MODOS_VALIDOS = {"tiempos", "cprofile", "memoria"}
+_SIN_PERFIL = nullcontext()  # Contexto vacío compartido cuando el perfilado está apagado
+
+class Histograma:
+    """Histograma logarítmico (base 2, en microsegundos) con conteo, total y máximo."""
+    __slots__ = ("cuenta", "total", "maximo", "cubetas")
+
+    def __init__(self):
+        self.cuenta = 0
+        self.total = 0.0
+        self.maximo = 0.0
+        self.cubetas = [0] * NUM_CUBETAS
+
+    def agregar(self, segundos):
+        """Registra una duración en segundos."""
+        self.cuenta += 1
+        self.total += segundos
+        if segundos > self.maximo:
+            self.maximo = segundos
+        cubeta = int(segundos * 1e6).bit_length()
+        self.cubetas[cubeta if cubeta < NUM_CUBETAS else NUM_CUBETAS - 1] += 1
+
+    def percentil(self, p):
+        """Cota superior (en segundos) del percentil p (0-100), según la cubeta donde cae."""
+        if not self.cuenta:
+            return 0.0
+        objetivo = p / 100 * self.cuenta
+        acumulado = 0
+        for cubeta, n in enumerate(self.cubetas):
+            acumulado += n
+            if acumulado >= objetivo:
+                return min((1 << cubeta) / 1e6, self.maximo)
+        return self.maximo
+
+class _Fase:
+    """Contexto que mide el tiempo de una fase y lo agrega a su histograma."""
+    __slots__ = ("histograma", "inicio")
+
+    def __init__(self, histograma):
+        self.histograma = histograma
+        self.inicio = 0.0
+
+    def __enter__(self):
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histograma.agregar(time.perf_counter() - self.inicio)
+        return False
+
+class Perfilador:
+    """
+    Reúne los tiempos por fase de una simulación y, opcionalmente, un perfil de cProfile
+    y las asignaciones de memoria de tracemalloc.
+    """
+    def __init__(self, nombre, modos=()):
+        self.nombre = nombre
+        self.modos = set(modos)
+        self.activo = bool(self.modos)
+        self.histogramas = {}  # nombre de fase -> Histograma
+        self._fases = {}  # nombre de fase -> _Fase reutilizable (las fases no se anidan consigo mismas)
+        self._ultimo_cuadro = None
+        self._perfil = None
+        self._inicio = time.perf_counter()
+
+    def histograma(self, nombre):
+        """Retorna (creándolo si hace falta) el histograma de una fase."""
+        if nombre not in self.histogramas:
+            self.histogramas[nombre] = Histograma()
+        return self.histogramas[nombre]
+
+    def fase(self, nombre):
+        """Contexto `with perfil.fase("dibujo"):` que mide el bloque."""
+        if not self.activo:
+            return _SIN_PERFIL
+        fase = self._fases.get(nombre)
+        if fase is None:
+            fase = self._fases[nombre] = _Fase(self.histograma(nombre))
+        return fase
+
+    def cuadro(self):
+        """Marca el fin de un cuadro (fotograma); registra el tiempo desde el cuadro anterior."""
+        if not self.activo:
+            return
+        ahora = time.perf_counter()
+        if self._ultimo_cuadro is not None:
+            self.histograma("cuadro").agregar(ahora - self._ultimo_cuadro)
+        self._ultimo_cuadro = ahora
+
+    def iniciar(self):
+        """Inicia cProfile/tracemalloc si se pidieron y programa el resumen al salir."""
+        if not self.activo:
+            return self
+        if "cprofile" in self.modos:
+            import cProfile
+            self._perfil = cProfile.Profile()
+            self._perfil.enable()
+        if "memoria" in self.modos:
+            import tracemalloc
+            tracemalloc.start()
+        atexit.register(self.resumen)
+        return self
+
+    def resumen(self, archivo=None):
+        """Imprime la tabla de tiempos por fase y, si están activos, los informes de cProfile y tracemalloc."""
+        archivo = archivo or sys.stderr
+        duracion = time.perf_counter() - self._inicio
+        print(f"\n=== Perfil de {self.nombre} ({duracion:.1f} s) ===", file=archivo)
+        if self.histogramas:
+            print(f"{'fase':<16}{'n':>8}{'total ms':>11}{'media ms':>10}{'p50 ms':>9}"
+                  f"{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}", file=archivo)
+            for nombre, h in sorted(self.histogramas.items(), key=lambda item: -item[1].total):
+                media = h.total / h.cuenta if h.cuenta else 0.0
+                print(f"{nombre:<16}{h.cuenta:>8}{h.total * 1e3:>11.1f}{media * 1e3:>10.3f}"
+                      f"{h.percentil(50) * 1e3:>9.3f}{h.percentil(95) * 1e3:>9.3f}"
+                      f"{h.percentil(99) * 1e3:>9.3f}{h.maximo * 1e3:>9.3f}", file=archivo)
+            print("(percentiles aproximados: cota superior de la cubeta en potencias de 2 µs)", file=archivo)
+
+        if self._perfil is not None:
+            import pstats
+            self._perfil.disable()
+            ruta = f"perfil_{self.nombre}.prof"
+            self._perfil.dump_stats(ruta)
+            print(f"\n--- cProfile (20 funciones con más tiempo acumulado; completo en {ruta}) ---", file=archivo)
+            pstats.Stats(self._perfil, stream=archivo).sort_stats("cumulative").print_stats(20)
+            self._perfil = None
+
+        if "memoria" in self.modos:
+            import tracemalloc
+            if tracemalloc.is_tracing():
+                actual, pico = tracemalloc.get_traced_memory()
+                print(f"\n--- tracemalloc: actual {actual / 1024:.1f} KiB, pico {pico / 1024:.1f} KiB ---",
+                      file=archivo)
+                for estadistica in tracemalloc.take_snapshot().statistics("lineno")[:10]:
+                    print(estadistica, file=archivo)
+                tracemalloc.stop()
+
+def _modos_configurados(argv):
+    """Lee los modos de PERFILADO y de --perfil[=modos]; quita --perfil de argv."""
+    valor = os.environ.get("PERFILADO", "")
+    for arg in list(argv[1:]):
+        if arg == "--perfil" or arg.startswith("--perfil="):
+            valor = arg.partition("=")[2] or "1"
+            argv.remove(arg)
+    valor = valor.strip().lower()
+    if valor in ("", "0", "no", "false"):
+        return set()
+    modos = {"tiempos"}  # Los tiempos por fase siempre se incluyen
+    for modo in valor.split(","):
+        modo = {"tracemalloc": "memoria", "1": "tiempos", "si": "tiempos"}.get(modo.strip(), modo.strip())
+        if modo in MODOS_VALIDOS:
+            modos.add(modo)
+        else:
+            print(f"perfilado: modo desconocido {modo!r} (válidos: {', '.join(sorted(MODOS_VALIDOS))})",
+                  file=sys.stderr)
+    return modos
+
+# Perfilador apagado compartido: valor de `perfil` hasta que el punto de entrada llama a crear()
+INACTIVO = Perfilador("inactivo")
+
+def crear(nombre, argv=None):
+    """Crea e inicia el perfilador de una simulación según PERFILADO/--perfil (inactivo por defecto)."""
+    return Perfilador(nombre, _modos_configurados(sys.argv if argv is None else argv)).iniciar()
@@ -1,33 +1,128 @@
 import tkinter as tk # Para la interfaz gráfica
 import math # Para cálculos matemáticos (distancia)
+import random # Para repartir muchos sensores en el lienzo
+import sys # Para leer el número de sensores desde la línea de comandos
+import os
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)) # perfilado.py está en la raíz del repositorio
+import perfilado # Perfilado opcional (PERFILADO=1 o --perfil)
+
+perfil = perfilado.INACTIVO # El bloque principal crea el perfilador real
+
+class IndiceRejilla:
+    """
+    Índice espacial de rejilla uniforme sobre los centros de los sensores.
+    Cada celda guarda los índices de los sensores que caen en ella, así las consultas
+    solo revisan las celdas cercanas en lugar de todos los sensores.
+    """
+    def __init__(self, puntos, tam_celda=50):
+        self.puntos = puntos  # Lista de centros (x, y)
+        self.tam_celda = tam_celda
+        self.celdas = {}  # (columna, fila) -> [índices de sensores]
+        for indice, (x, y) in enumerate(puntos):
+            self.celdas.setdefault(self.celda(x, y), []).append(indice)
+
+        # Límites de las celdas ocupadas, para saber cuándo dejar de buscar
+        if self.celdas:
+            columnas = [c for c, _ in self.celdas]
+            filas = [f for _, f in self.celdas]
+            self.limites = (min(columnas), min(filas), max(columnas), max(filas))
+
+    def celda(self, x, y):
+        """Retorna la celda (columna, fila) que contiene el punto (x, y)."""
+        return int(x // self.tam_celda), int(y // self.tam_celda)
+
+    def en_radio(self, x, y, radio):
+        """Retorna los índices de los sensores a una distancia <= radio de (x, y)."""
+        c1, f1 = self.celda(x - radio, y - radio)
+        c2, f2 = self.celda(x + radio, y + radio)
+        radio2 = radio * radio
+        encontrados = []
+        for c in range(c1, c2 + 1):
+            for f in range(f1, f2 + 1):
+                for indice in self.celdas.get((c, f), ()):
+                    px, py = self.puntos[indice]
+                    if (px - x)**2 + (py - y)**2 <= radio2:
+                        encontrados.append(indice)
+        return encontrados
+
+    def mas_cercano(self, x, y):
+        """
+        Retorna (índice, distancia) del sensor más cercano a (x, y), o (None, inf) si no hay sensores.
+        Busca por anillos de celdas alrededor del punto hasta que ningún anillo más lejano
+        pueda contener un sensor más cercano.
+        """
+        if not self.celdas:
+            return None, math.inf
+
+        c0, f0 = self.celda(x, y)
+        cmin, fmin, cmax, fmax = self.limites
+        # Anillo más lejano que todavía puede tocar una celda ocupada
+        anillo_max = max(abs(c0 - cmin), abs(c0 - cmax), abs(f0 - fmin), abs(f0 - fmax))
+
+        mejor, mejor_d2 = None, math.inf
+        for anillo in range(anillo_max + 1):
+            # Recorre solo el borde del cuadrado de celdas a distancia 'anillo'
+            for c in range(c0 - anillo, c0 + anillo + 1):
+                paso = 1 if abs(c - c0) == anillo else 2 * anillo
+                for f in range(f0 - anillo, f0 + anillo + 1, paso):
+                    for indice in self.celdas.get((c, f), ()):
+                        px, py = self.puntos[indice]
+                        d2 = (px - x)**2 + (py - y)**2
+                        if d2 < mejor_d2:
+                            mejor, mejor_d2 = indice, d2
+            # Cualquier sensor fuera de este anillo está al menos a anillo * tam_celda
+            if mejor is not None and mejor_d2 <= (anillo * self.tam_celda)**2:
+                break
+        return mejor, math.sqrt(mejor_d2)
 
 class SensorInteractivo:
     """
-    Simula la interacción entre un sensor fijo (rojo) y un objeto movible (azul)
-    en un lienzo (Canvas) de Tkinter, calculando y mostrando la distancia entre ellos.
+    Simula la interacción entre sensores fijos (rojos) y un objeto movible (azul)
+    en un lienzo (Canvas) de Tkinter, calculando y mostrando la distancia al sensor más cercano.
+
+    Las posiciones se guardan en Python (no se leen del canvas) y un índice de rejilla
+    responde "sensor más cercano" y "sensores dentro del radio", de modo que el lienzo
+    solo se actualiza cuando algo cambia.
     """
-    def __init__(self, root):
+    def __init__(self, root, sensores=None, radio=100, tam_sensor=50):
         self.root = root
         self.root.title("Simulador de Sensor")  # Título de la ventana
-        
+
         # Canvas (área de dibujo)
         self.canvas = tk.Canvas(root, width=400, height=400, bg="white")
         self.canvas.pack()
-        
-        # Sensor (cuadrado rojo fijo) - Coordenadas (x1, y1, x2, y2)
-        self.sensor = self.canvas.create_rectangle(50, 50, 100, 100, fill="red", tags="sensor")
-        
-        # Objeto (cuadrado azul movible)
-        self.objeto = self.canvas.create_rectangle(300, 300, 350, 350, fill="blue", tags="objeto")
-        
+
+        # Modelo: centros de los sensores y del objeto, independientes del canvas
+        self.sensores = list(sensores) if sensores is not None else [(75, 75)]
+        self.objeto_x, self.objeto_y = 325, 325
+        self.radio = radio  # Radio para la consulta "sensores dentro de R"
+        self.indice = IndiceRejilla(self.sensores, tam_celda=max(radio, tam_sensor))
+
+        # Sensores (cuadrados rojos fijos) - Coordenadas (x1, y1, x2, y2)
+        medio = tam_sensor / 2
+        self.items_sensor = [
+            self.canvas.create_rectangle(x - medio, y - medio, x + medio, y + medio,
+                                         fill="red", outline="", tags="sensor")
+            for x, y in self.sensores
+        ]
+
+        # Objeto (cuadrado azul movible) y su radio de detección, ambos con la etiqueta "objeto"
+        ox, oy = self.objeto_x, self.objeto_y
+        self.canvas.create_oval(ox - radio, oy - radio, ox + radio, oy + radio,
+                                outline="gray", dash=(4, 2), tags="objeto")
+        self.objeto = self.canvas.create_rectangle(ox - 25, oy - 25, ox + 25, oy + 25, fill="blue", tags="objeto")
+
         # Etiqueta de distancia
         self.label_distancia = tk.Label(root, text="Distancia: 0 píxeles", font=("Arial", 14))
         self.label_distancia.pack()
-        
+
         # 🔑 Conectar las teclas de flecha al método mover_objeto
         # Se necesita un 'focus' para que el evento de teclado sea capturado
         self.root.bind("<Key>", self.mover_objeto)
-        
+
+        # Sensores resaltados actualmente (dentro del radio)
+        self.en_rango = set()
+
         # Inicializar la distancia
         self.actualizar_distancia()
 
@@ -36,7 +131,7 @@ class SensorInteractivo:
         Maneja el evento de teclado (flechas) para mover el objeto.
         """
         x, y = 0, 0
-        
+
         if event.keysym == "Up":
             y = -10  # Mover arriba
         elif event.keysym == "Down":
@@ -45,35 +140,54 @@ class SensorInteractivo:
             x = -10  # Mover izquierda
         elif event.keysym == "Right":
             x = 10   # Mover derecha
-            
-        self.canvas.move("objeto", x, y)  # Actualiza posición en el canvas
-        self.actualizar_distancia()      # Recalcula distancia
+        else:
+            return   # Otras teclas no cambian nada
+
+        with perfil.fase("tecla"):
+            self.objeto_x += x
+            self.objeto_y += y
+            self.canvas.move("objeto", x, y)  # Actualiza posición en el canvas
+            self.actualizar_distancia()      # Recalcula distancia
 
     def actualizar_distancia(self):
         """
-        Calcula la distancia euclidiana entre el centro del sensor y el centro del objeto.
+        Consulta el índice para obtener el sensor más cercano y los sensores dentro del radio,
+        y actualiza solo los elementos del canvas que cambiaron.
         """
-        # 1. Obtener coordenadas del sensor [x1, y1, x2, y2]
-        sensor_coords = self.canvas.coords("sensor")
-        # Calcular el centro del sensor
-        sensor_cx = (sensor_coords[0] + sensor_coords[2]) / 2
-        sensor_cy = (sensor_coords[1] + sensor_coords[3]) / 2
-
-        # 2. Obtener coordenadas del objeto [x1, y1, x2, y2]
-        objeto_coords = self.canvas.coords("objeto")
-        # Calcular el centro del objeto
-        objeto_cx = (objeto_coords[0] + objeto_coords[2]) / 2
-        objeto_cy = (objeto_coords[1] + objeto_coords[3]) / 2
-
-        # 3. Aplicar la fórmula de la distancia euclidiana
-        # Distancia = sqrt((x2 - x1)^2 + (y2 - y1)^2)
-        distancia = math.sqrt((objeto_cx - sensor_cx)**2 + (objeto_cy - sensor_cy)**2)
-        
-        # 4. Actualizar la etiqueta
-        self.label_distancia.config(text=f"Distancia: {int(distancia)} píxeles")
+        with perfil.fase("consulta"):
+            # 1. Sensor más cercano (distancia euclidiana entre centros)
+            cercano, distancia = self.indice.mas_cercano(self.objeto_x, self.objeto_y)
+            # 2. Sensores dentro del radio
+            en_rango = set(self.indice.en_radio(self.objeto_x, self.objeto_y, self.radio))
+
+        with perfil.fase("dibujo"):
+            # Solo se recolorean los sensores que entran o salen del radio
+            for indice in en_rango - self.en_rango:
+                self.canvas.itemconfig(self.items_sensor[indice], fill="orange")
+            for indice in self.en_rango - en_rango:
+                self.canvas.itemconfig(self.items_sensor[indice], fill="red")
+        self.en_rango = en_rango
+
+        # 3. Actualizar la etiqueta
+        if cercano is None:
+            self.label_distancia.config(text="Distancia: sin sensores")
+        elif len(self.sensores) == 1:
+            self.label_distancia.config(text=f"Distancia: {int(distancia)} píxeles")
+        else:
+            self.label_distancia.config(
+                text=f"Distancia: {int(distancia)} píxeles (sensor {cercano}), en rango: {len(en_rango)}"
+            )
 
 # --- Bloque principal de ejecución ---
 if __name__ == "__main__":
+    # Uso: python sensor_interactivo.py [numero_de_sensores] [--perfil[=modos]]
+    perfil = perfilado.crear("sensor_interactivo") # Antes de leer sys.argv, porque quita --perfil
+
+    num_sensores = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    sensores = None
+    if num_sensores > 1:
+        sensores = [(random.uniform(0, 400), random.uniform(0, 400)) for _ in range(num_sensores)]
+
     root = tk.Tk()           # Crear ventana principal
-    app = SensorInteractivo(root)  # Iniciar el simulador
-    root.mainloop()          # Mantener la ventana abierta
\ No newline at end of file
+    app = SensorInteractivo(root, sensores, tam_sensor=50 if num_sensores == 1 else 4)  # Iniciar el simulador
+    root.mainloop()          # Mantener la ventana abierta
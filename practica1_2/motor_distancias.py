@@ -0,0 +1,137 @@
+import numpy as np  # Para el cálculo vectorizado de distancias
+import csv  # Para guardar los eventos de cruce de umbral
+import os  # Para manejar rutas de archivos
+
+class MotorDistancias:
+    """
+    Motor sin interfaz gráfica que calcula las distancias entre N sensores fijos
+    y M objetos móviles a lo largo de T fotogramas.
+
+    El tensor de distancias (T, N, M) se calcula por bloques de fotogramas para
+    limitar la memoria, se escribe directamente a un archivo .npy y se detectan
+    los eventos de entrada/salida del rango de cada sensor.
+    """
+    def __init__(self, sensores, umbral, tam_bloque=256):
+        self.sensores = np.asarray(sensores, dtype=np.float64)  # Centros de los sensores (N, 2)
+        if self.sensores.ndim != 2 or self.sensores.shape[1] != 2:
+            raise ValueError("Los sensores deben tener forma (N, 2).")
+        self.umbral = float(umbral)  # Rango de detección de cada sensor
+        self.tam_bloque = int(tam_bloque)  # Fotogramas procesados por bloque
+        if self.tam_bloque <= 0:
+            raise ValueError("El tamaño de bloque debe ser positivo.")
+
+    def distancias_bloque(self, posiciones):
+        """
+        Calcula las distancias de un bloque de posiciones (B, M, 2) a todos los sensores.
+        Devuelve un arreglo (B, N, M) usando broadcasting, sin bucles de Python.
+        """
+        posiciones = np.asarray(posiciones, dtype=np.float64)
+        # (B, 1, M, 2) - (1, N, 1, 2) -> (B, N, M, 2)
+        diferencia = posiciones[:, np.newaxis, :, :] - self.sensores[np.newaxis, :, np.newaxis, :]
+        return np.hypot(diferencia[..., 0], diferencia[..., 1])
+
+    def calcular(self, trayectorias, archivo_salida="distancias.npy", archivo_eventos="eventos_sensor.csv"):
+        """
+        Procesa las trayectorias (T, M, 2) bloque a bloque.
+
+        Las distancias se guardan en `archivo_salida` como un .npy de forma (T, N, M)
+        que se puede abrir con np.load(..., mmap_mode='r'). Los eventos se guardan en
+        `archivo_eventos` con las columnas Frame, Sensor, Objeto, Evento ('entra'/'sale').
+        Devuelve un resumen con el número de eventos y la distancia mínima de cada par.
+        """
+        trayectorias = np.asarray(trayectorias)  # No copia si ya es un arreglo (o memmap)
+        if trayectorias.ndim != 3 or trayectorias.shape[2] != 2:
+            raise ValueError("Las trayectorias deben tener forma (T, M, 2).")
+
+        total_frames, num_objetos = trayectorias.shape[0], trayectorias.shape[1]
+        num_sensores = self.sensores.shape[0]
+
+        # Archivo .npy mapeado en memoria: solo el bloque actual vive en RAM
+        salida = np.lib.format.open_memmap(
+            archivo_salida, mode="w+", dtype=np.float32,
+            shape=(total_frames, num_sensores, num_objetos)
+        )
+
+        minimos = np.full((num_sensores, num_objetos), np.inf)
+        dentro_anterior = None  # Estado (N, M) del último fotograma del bloque previo
+        num_eventos = 0
+
+        with open(archivo_eventos, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["Frame", "Sensor", "Objeto", "Evento"])
+
+            for inicio in range(0, total_frames, self.tam_bloque):
+                fin = min(inicio + self.tam_bloque, total_frames)
+                distancias = self.distancias_bloque(trayectorias[inicio:fin])
+                salida[inicio:fin] = distancias
+                np.minimum(minimos, distancias.min(axis=0), out=minimos)
+
+                # Detección de cruces: se compara cada fotograma con el anterior
+                dentro = distancias < self.umbral
+                if dentro_anterior is None:
+                    previo = np.zeros_like(dentro[:1])  # Al inicio nadie está dentro del rango
+                else:
+                    previo = dentro_anterior[np.newaxis]
+                cambios = dentro != np.concatenate((previo, dentro[:-1]), axis=0)
+
+                frames, sensores, objetos = np.nonzero(cambios)
+                eventos = np.where(dentro[cambios], "entra", "sale")  # Mismo orden que np.nonzero
+                writer.writerows(zip((frames + inicio).tolist(), sensores.tolist(), objetos.tolist(), eventos.tolist()))
+                num_eventos += len(frames)
+
+                dentro_anterior = dentro[-1]
+
+        salida.flush()
+        del salida  # Cierra el mapeo del archivo
+
+        return {
+            "frames": total_frames,
+            "sensores": num_sensores,
+            "objetos": num_objetos,
+            "eventos": num_eventos,
+            "distancia_minima": minimos,
+        }
+
+def trayectorias_circulares(frames, num_objetos, centro=(5, 5), radio=3, paso=0.1):
+    """
+    Genera M trayectorias circulares desfasadas (T, M, 2), como el movimiento de SensorAnimado.
+    """
+    angulos = np.arange(frames)[:, np.newaxis] * paso + np.linspace(0, 2 * np.pi, num_objetos, endpoint=False)
+    x = centro[0] + radio * np.cos(angulos)
+    y = centro[1] + radio * np.sin(angulos)
+    return np.stack((x, y), axis=-1)
+
+def visualizar(archivo_salida, sensores, trayectorias, sensor=0, objeto=0, inicio=0, fin=None,
+               archivo_csv="datos_rebanada.csv"):
+    """
+    Anima con SensorAnimado una rebanada de la salida: un sensor, un objeto y un rango de fotogramas.
+    Las distancias de la animación se registran en `archivo_csv`.
+    """
+    import matplotlib.pyplot as plt  # Solo se necesita para visualizar
+    from sensor_animado import SensorAnimado
+
+    distancias = np.load(archivo_salida, mmap_mode="r")
+    rebanada = slice(inicio, fin)
+    animacion = SensorAnimado(
+        trayectoria=np.asarray(trayectorias[rebanada, objeto]),
+        sensor_centro=tuple(np.asarray(sensores)[sensor]),
+        distancias=np.asarray(distancias[rebanada, sensor, objeto]),
+        csv_file=archivo_csv,  # No sobrescribir datos_sensor.csv de la simulación normal
+    )
+    plt.show()
+    return animacion
+
+# --- Ejecución principal ---
+if __name__ == "__main__":
+    # Rejilla de 10x10 sensores sobre el área de 10x10 de SensorAnimado
+    ejes = np.linspace(0.5, 9.5, 10)
+    sensores = np.array([(x, y) for x in ejes for y in ejes])
+    trayectorias = trayectorias_circulares(frames=5000, num_objetos=20)
+
+    motor = MotorDistancias(sensores, umbral=1.5)
+    resumen = motor.calcular(trayectorias)
+
+    print(f"Fotogramas: {resumen['frames']}, Sensores: {resumen['sensores']}, Objetos: {resumen['objetos']}")
+    print(f"Eventos de entrada/salida: {resumen['eventos']}")
+    print(f"Distancias guardadas en: {os.path.abspath('distancias.npy')}")
+    print(f"Eventos guardados en: {os.path.abspath('eventos_sensor.csv')}")
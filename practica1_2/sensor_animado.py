@@ -4,20 +4,38 @@ import matplotlib.animation as animation  # Para animaciones
 from matplotlib.patches import Rectangle  # Para dibujar los objetos
 import csv  # Para guardar datos en un archivo CSV
 import os  # Para manejar rutas de archivos
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))  # perfilado.py está en la raíz del repositorio
+import perfilado  # Perfilado opcional (PERFILADO=1 o --perfil)
+
+perfil = perfilado.INACTIVO  # Sin medir al importar (p. ej. desde motor_distancias.visualizar)
 
 class SensorAnimado:
     """
     Simula el movimiento de un objeto (azul) en relación con un sensor fijo (rojo)
     y guarda la distancia calculada en un archivo CSV.
+
+    Opcionalmente reproduce una trayectoria (T, 2) ya calculada, por ejemplo una
+    rebanada de la salida de MotorDistancias, en lugar del movimiento circular.
     """
-    def __init__(self):
+    def __init__(self, trayectoria=None, sensor_centro=(1.5, 1.5), distancias=None, csv_file='datos_sensor.csv'):
+        self.trayectoria = None if trayectoria is None else np.asarray(trayectoria)
+        self.distancias = None if distancias is None else np.asarray(distancias)
+        self.sensor_centro = sensor_centro  # Centro del sensor, usado para la distancia
+        
         self.fig, self.ax = plt.subplots()  # Crear la figura y los ejes
-        self.ax.set_xlim(0, 10)  # Limitar el área en X
-        self.ax.set_ylim(0, 10)  # Limitar el área en Y
+        if self.trayectoria is None:
+            self.ax.set_xlim(0, 10)  # Limitar el área en X
+            self.ax.set_ylim(0, 10)  # Limitar el área en Y
+        else:
+            # Ajustar el área para que quepan la trayectoria y el sensor
+            puntos = np.vstack((self.trayectoria, [sensor_centro]))
+            self.ax.set_xlim(min(0, puntos[:, 0].min() - 1), max(10, puntos[:, 0].max() + 1))
+            self.ax.set_ylim(min(0, puntos[:, 1].min() - 1), max(10, puntos[:, 1].max() + 1))
         self.ax.set_aspect('equal', adjustable='box') # Mantener la proporción
         
         # Cuadrado-sensor (fijo)
-        self.sensor = Rectangle((1, 1), 1, 1, color='r')  # Sensor en posición fija
+        self.sensor = Rectangle((sensor_centro[0] - 0.5, sensor_centro[1] - 0.5), 1, 1, color='r')  # Sensor en posición fija
         self.ax.add_patch(self.sensor)
         
         # Cuadrado-objeto (móvil)
@@ -25,17 +43,20 @@ class SensorAnimado:
         self.ax.add_patch(self.objeto)
         
         # Texto de distancia en la pantalla
-        self.dist_text = self.ax.text(0.5, 9.5, "Distancia: 0.00", fontsize=12)
+        self.dist_text = self.ax.text(0.05, 0.95, "Distancia: 0.00", fontsize=12,
+                                      transform=self.ax.transAxes)  # Esquina superior izquierda, sin importar los límites
         
         # Configuración del archivo CSV
-        self.csv_file = 'datos_sensor.csv'
+        self.csv_file = csv_file
         with open(self.csv_file, 'w', newline='') as f:
             writer = csv.writer(f)
             writer.writerow(['Frame', 'Pos_X', 'Pos_Y', 'Distancia'])
             
         # Inicializar la animación
         self.anim = animation.FuncAnimation(
-            self.fig, self.actualizar, frames=60, interval=100, blit=False
+            self.fig, self.actualizar,
+            frames=60 if self.trayectoria is None else len(self.trayectoria),
+            interval=100, blit=False
         )
 
     def actualizar(self, frame):
@@ -43,20 +64,29 @@ class SensorAnimado:
         Función de actualización llamada en cada fotograma de la animación.
         Mueve el objeto, calcula la distancia y guarda los datos.
         """
-        # Mover el objeto en círculos (basado en el seno y coseno)
-        angle = frame * 0.1  # Ángulo para el movimiento
-        x = 5 + 3 * np.cos(angle)  # Nueva posición X
-        y = 5 + 3 * np.sin(angle)  # Nueva posición Y
-        
-        self.objeto.set_xy((x, y))  # Actualizar posición del objeto (esquina inferior izquierda)
-        
-        # Calcular distancia. El sensor está centrado en (1.5, 1.5)
-        distancia = np.sqrt((x - 1.5)**2 + (y - 1.5)**2)
+        perfil.cuadro()  # Tiempo entre fotogramas (incluye el dibujo de matplotlib)
+
+        with perfil.fase("actualizacion"):
+            if self.trayectoria is None:
+                # Mover el objeto en círculos (basado en el seno y coseno)
+                angle = frame * 0.1  # Ángulo para el movimiento
+                x = 5 + 3 * np.cos(angle)  # Nueva posición X
+                y = 5 + 3 * np.sin(angle)  # Nueva posición Y
+            else:
+                x, y = self.trayectoria[frame]  # Posición precalculada
+            
+            if self.distancias is not None:
+                distancia = self.distancias[frame]  # Distancia ya calculada por el motor
+            else:
+                # Calcular distancia al centro del sensor (por defecto (1.5, 1.5))
+                distancia = np.sqrt((x - self.sensor_centro[0])**2 + (y - self.sensor_centro[1])**2)
         
-        self.dist_text.set_text(f"Distancia: {distancia:.2f}")
+        with perfil.fase("dibujo"):
+            self.objeto.set_xy((x, y))  # Actualizar posición del objeto (esquina inferior izquierda)
+            self.dist_text.set_text(f"Distancia: {distancia:.2f}")
         
         # Guardar datos en CSV
-        with open(self.csv_file, 'a', newline='') as f:
+        with perfil.fase("registro"), open(self.csv_file, 'a', newline='') as f:
             writer = csv.writer(f)
             writer.writerow([frame, x, y, distancia])
             
@@ -64,6 +94,8 @@ class SensorAnimado:
 
 # --- Ejecución principal ---
 if __name__ == "__main__":
+    perfil = perfilado.crear("sensor_animado")
+
     sensor = SensorAnimado()
     plt.show()
     
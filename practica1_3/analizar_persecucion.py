@@ -0,0 +1,225 @@
+import argparse  # Para las opciones de la línea de comandos
+import io  # Para pasar cada bloque de texto a numpy
+import os  # Para conocer el tamaño del archivo
+import sys
+from concurrent.futures import ProcessPoolExecutor  # Para analizar rangos del archivo en paralelo
+
+import numpy as np  # Para calcular las métricas de cada bloque de forma vectorizada
+
+RADIO_CERCA = 100  # Mismo radio con el que el perseguidor se pone verde en el juego
+TAM_OBJETO = 30  # Lado de los cuadrados del juego; si se tocan cuenta como captura
+BLOQUE = 8 * 1024 * 1024  # Bytes leídos por bloque
+SEGUNDOS_DIA = 24 * 3600  # Los timestamps son HH:MM:SS.ffffff y se reinician a medianoche
+
+class Resumen:
+    """
+    Agregados de un tramo contiguo del registro (un bloque, un rango o el archivo completo).
+
+    Además de las sumas guarda la primera y la última fila del tramo, para que al unir dos
+    tramos consecutivos se cuente bien el intervalo entre ellos y las capturas que empiezan
+    justo en el borde.
+    """
+    def __init__(self, perseguidores):
+        self.perseguidores = perseguidores
+        self.filas = 0
+        self.duracion = 0.0  # Segundos entre la primera y la última fila
+        # Tiempo dentro del radio de cada perseguidor y (última columna) de cualquiera
+        self.tiempo_cerca = np.zeros(perseguidores + 1)
+        self.capturas = np.zeros(perseguidores, dtype=np.int64)  # Capturas que empiezan dentro del tramo
+        self.distancia_min = np.full(perseguidores, np.inf)
+        self.momento_min = np.zeros(perseguidores)  # Timestamp (segundos del día) de cada mínimo
+        self.suma_distancia = np.zeros(perseguidores)
+        # Estado de los bordes del tramo
+        self.t_primera = self.t_ultima = None
+        self.captura_primera = self.captura_ultima = None
+        self.cerca_ultima = None
+
+    @classmethod
+    def de_bloque(cls, datos, radio=RADIO_CERCA, tam=TAM_OBJETO):
+        """
+        Calcula los agregados de un bloque ya leído: columnas h, m, s, jugador_x, jugador_y,
+        obj1_x, obj1_y, obj2_x, ...
+        """
+        perseguidores = (datos.shape[1] - 5) // 2
+        r = cls(perseguidores)
+        if not len(datos):
+            return r
+
+        t = datos[:, 0] * 3600 + datos[:, 1] * 60 + datos[:, 2]
+        jugador = datos[:, 3:5]
+        objetos = datos[:, 5:5 + 2 * perseguidores].reshape(len(datos), perseguidores, 2)
+
+        # Distancias jugador-perseguidor (n, K)
+        delta = objetos - jugador[:, np.newaxis, :]
+        distancias = np.hypot(delta[..., 0], delta[..., 1])
+        cerca = distancias < radio
+        cerca = np.column_stack((cerca, cerca.any(axis=1)))  # (n, K + 1)
+        captura = (np.abs(delta) < tam).all(axis=2)  # Los cuadrados se superponen
+
+        # Intervalos entre filas: cuentan como "cerca" si la fila inicial lo estaba
+        dt = np.diff(t)
+        dt[dt < 0] += SEGUNDOS_DIA
+        r.tiempo_cerca = dt @ cerca[:-1]
+        r.duracion = dt.sum()
+
+        # Capturas: filas capturadas cuya fila anterior no lo estaba
+        r.capturas = (captura[1:] & ~captura[:-1]).sum(axis=0)
+
+        indices = distancias.argmin(axis=0)
+        r.distancia_min = distancias[indices, np.arange(perseguidores)]
+        r.momento_min = t[indices]
+        r.suma_distancia = distancias.sum(axis=0)
+
+        r.filas = len(datos)
+        r.t_primera, r.t_ultima = t[0], t[-1]
+        r.captura_primera, r.captura_ultima = captura[0], captura[-1]
+        r.cerca_ultima = cerca[-1]
+        return r
+
+    def combinar(self, siguiente):
+        """Une este tramo con el tramo que le sigue en el archivo y retorna el resultado."""
+        if not siguiente.filas:
+            return self
+        if not self.filas:
+            return siguiente
+
+        r = Resumen(self.perseguidores)
+        r.filas = self.filas + siguiente.filas
+
+        # Intervalo entre la última fila de este tramo y la primera del siguiente
+        hueco = siguiente.t_primera - self.t_ultima
+        if hueco < 0:
+            hueco += SEGUNDOS_DIA
+        r.duracion = self.duracion + hueco + siguiente.duracion
+        r.tiempo_cerca = self.tiempo_cerca + hueco * self.cerca_ultima + siguiente.tiempo_cerca
+        r.capturas = (self.capturas + siguiente.capturas
+                      + (siguiente.captura_primera & ~self.captura_ultima))
+
+        mejor = siguiente.distancia_min < self.distancia_min
+        r.distancia_min = np.where(mejor, siguiente.distancia_min, self.distancia_min)
+        r.momento_min = np.where(mejor, siguiente.momento_min, self.momento_min)
+        r.suma_distancia = self.suma_distancia + siguiente.suma_distancia
+
+        r.t_primera, r.captura_primera = self.t_primera, self.captura_primera
+        r.t_ultima, r.captura_ultima = siguiente.t_ultima, siguiente.captura_ultima
+        r.cerca_ultima = siguiente.cerca_ultima
+        return r
+
+    def total_capturas(self):
+        """Capturas del archivo completo (una captura en la primera fila también cuenta)."""
+        if not self.filas:
+            return self.capturas
+        return self.capturas + self.captura_primera
+
+def parsear(texto, columnas):
+    """Convierte líneas 'HH:MM:SS.ffffff,x,y,...' en un arreglo numérico (n, columnas + 2)."""
+    if not texto.strip():
+        return np.empty((0, columnas + 2))
+    # Separar horas, minutos y segundos como columnas numéricas más
+    return np.loadtxt(io.StringIO(texto.replace(":", ",")), delimiter=",", ndmin=2)
+
+def leer_encabezado(archivo):
+    """Retorna (número de columnas, byte donde empiezan los datos)."""
+    with open(archivo, "rb") as f:
+        encabezado = f.readline()
+        return len(encabezado.decode("utf-8").strip().split(",")), f.tell()
+
+def analizar_rango(archivo, inicio, fin, columnas, bloque=BLOQUE, radio=RADIO_CERCA, tam=TAM_OBJETO):
+    """
+    Analiza las líneas completas entre los bytes [inicio, fin) leyendo bloques de tamaño fijo.
+    La memoria usada depende del tamaño de bloque, no del tamaño del archivo.
+    """
+    perseguidores = (columnas - 3) // 2
+    resumen = Resumen(perseguidores)
+    resto = b""
+    with open(archivo, "rb") as f:
+        f.seek(inicio)
+        pendiente = fin - inicio
+        while pendiente > 0:
+            datos = f.read(min(bloque, pendiente))
+            if not datos:
+                break
+            pendiente -= len(datos)
+            datos = resto + datos
+            corte = datos.rfind(b"\n") + 1  # Solo se procesan líneas completas
+            resto = datos[corte:]
+            if corte:
+                texto = datos[:corte].decode("utf-8")
+                resumen = resumen.combinar(Resumen.de_bloque(parsear(texto, columnas), radio, tam))
+
+    # Última línea sin salto de línea: se usa solo si está completa (el juego pudo cortarse al escribir)
+    linea = resto.decode("utf-8").strip()
+    if linea and linea.count(",") == columnas - 1:
+        resumen = resumen.combinar(Resumen.de_bloque(parsear(linea, columnas), radio, tam))
+    return resumen
+
+def dividir_rangos(archivo, inicio, partes):
+    """Divide [inicio, tamaño del archivo) en `partes` rangos que empiezan al principio de una línea."""
+    tamaño = os.path.getsize(archivo)
+    cortes = [inicio]
+    with open(archivo, "rb") as f:
+        for k in range(1, partes):
+            f.seek(max(inicio + (tamaño - inicio) * k // partes, cortes[-1]))
+            f.readline()  # Avanza hasta el inicio de la siguiente línea
+            cortes.append(min(f.tell(), tamaño))
+    cortes.append(tamaño)
+    return [(a, b) for a, b in zip(cortes, cortes[1:]) if b > a]
+
+def analizar(archivo, procesos=1, bloque=BLOQUE, radio=RADIO_CERCA, tam=TAM_OBJETO):
+    """Analiza el registro completo; con procesos > 1 reparte rangos del archivo entre varios procesos."""
+    columnas, inicio = leer_encabezado(archivo)
+    if columnas < 5 or (columnas - 3) % 2:
+        raise ValueError(f"Encabezado inesperado: {columnas} columnas (se esperaban Timestamp, Player_X/Y, ObjN_X/Y)")
+
+    rangos = dividir_rangos(archivo, inicio, max(1, procesos))
+    if procesos > 1 and len(rangos) > 1:
+        with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+            parciales = list(ejecutor.map(analizar_rango, *zip(*[
+                (archivo, a, b, columnas, bloque, radio, tam) for a, b in rangos
+            ])))
+    else:
+        parciales = [analizar_rango(archivo, a, b, columnas, bloque, radio, tam) for a, b in rangos]
+
+    # Los tramos se combinan en el orden del archivo
+    resumen = Resumen((columnas - 3) // 2)
+    for parcial in parciales:
+        resumen = resumen.combinar(parcial)
+    return resumen
+
+def hora(segundos):
+    """Formatea segundos del día como HH:MM:SS.mmm."""
+    segundos = float(segundos) % SEGUNDOS_DIA
+    h, resto = divmod(segundos, 3600)
+    m, s = divmod(resto, 60)
+    return f"{int(h):02d}:{int(m):02d}:{s:06.3f}"
+
+def imprimir(resumen, radio=RADIO_CERCA):
+    """Muestra el reporte del análisis."""
+    print(f"Filas: {resumen.filas}, Duración: {resumen.duracion:.2f} s")
+    if not resumen.filas:
+        return
+    capturas = resumen.total_capturas()
+    for k in range(resumen.perseguidores):
+        porcentaje = 100 * resumen.tiempo_cerca[k] / resumen.duracion if resumen.duracion else 0.0
+        print(f"Perseguidor {k + 1}: distancia mínima {resumen.distancia_min[k]:.1f} px "
+              f"(a las {hora(resumen.momento_min[k])}), media {resumen.suma_distancia[k] / resumen.filas:.1f} px, "
+              f"dentro de {radio} px {resumen.tiempo_cerca[k]:.2f} s ({porcentaje:.1f}%), "
+              f"capturas {capturas[k]}")
+    porcentaje = 100 * resumen.tiempo_cerca[-1] / resumen.duracion if resumen.duracion else 0.0
+    print(f"Algún perseguidor dentro de {radio} px: {resumen.tiempo_cerca[-1]:.2f} s ({porcentaje:.1f}%)")
+
+# --- Ejecución principal ---
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Analiza datos_persecucion.csv por bloques, sin cargarlo completo.")
+    parser.add_argument("archivo", nargs="?", default="datos_persecucion.csv")
+    parser.add_argument("--bloque", type=float, default=BLOQUE / 2**20, help="tamaño de bloque en MiB (8 por defecto)")
+    parser.add_argument("--procesos", type=int, default=1, help="procesos para analizar rangos del archivo en paralelo")
+    parser.add_argument("--radio", type=float, default=RADIO_CERCA, help="radio de proximidad en píxeles")
+    args = parser.parse_args()
+
+    try:
+        resultado = analizar(args.archivo, args.procesos, max(1, int(args.bloque * 2**20)), args.radio)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    imprimir(resultado, args.radio)
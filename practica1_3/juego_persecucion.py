@@ -5,6 +5,10 @@ import csv
 import os
 from datetime import datetime
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))  # perfilado.py está en la raíz del repositorio
+import perfilado  # Perfilado opcional (PERFILADO=1 o --perfil)
+perfil = perfilado.crear("juego_persecucion")
+
 # --- 1. Inicialización de Pygame y Constantes ---
 pygame.init()
 
@@ -105,21 +109,23 @@ with open(csv_file, 'w', newline='') as f:
 running = True
 while running:
     # 1. Manejo de Eventos (Cerrar la ventana)
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
+    with perfil.fase("entrada"):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+        keys = pygame.key.get_pressed()
             
     # 2. Lógica del Juego
-    keys = pygame.key.get_pressed()
-    sensor.move(keys) # Mover el jugador/sensor
-    
-    # Mover a los perseguidores hacia el centro del sensor
-    for obj in objetos:
-        obj.move(sensor.rect.center)
+    with perfil.fase("actualizacion"):
+        sensor.move(keys) # Mover el jugador/sensor
+        
+        # Mover a los perseguidores hacia el centro del sensor
+        for obj in objetos:
+            obj.move(sensor.rect.center)
     
     # 3. Registro de Datos (Se registra cada 5 ciclos de reloj)
     if pygame.time.get_ticks() % 5 == 0:
-        with open(csv_file, 'a', newline='') as f:
+        with perfil.fase("registro"), open(csv_file, 'a', newline='') as f:
             writer = csv.writer(f)
             writer.writerow([
                 datetime.now().strftime("%H:%M:%S.%f"),
@@ -132,18 +138,22 @@ while running:
             ])
     
     # 4. Dibujo
-    screen.fill(BLACK) # Limpiar la pantalla
-    sensor.draw()
-    for obj in objetos:
-        obj.draw()
-    
-    # Mostrar texto de ayuda
-    text = font.render("Usa las flechas en tu teclado para moverte. Objetos te persiguen!", True, WHITE)
-    screen.blit(text, (10, 10))
-    
-    # 5. Actualizar la Pantalla y Controlar FPS
-    pygame.display.flip()
+    with perfil.fase("dibujo"):
+        screen.fill(BLACK) # Limpiar la pantalla
+        sensor.draw()
+        for obj in objetos:
+            obj.draw()
+        
+        # Mostrar texto de ayuda
+        text = font.render("Usa las flechas en tu teclado para moverte. Objetos te persiguen!", True, WHITE)
+        screen.blit(text, (10, 10))
+        
+        # 5. Actualizar la Pantalla
+        pygame.display.flip()
+
+    # Controlar FPS (la espera no cuenta como fase; el tiempo total del cuadro sí)
     clock.tick(60) # Limita el juego a 60 fotogramas por segundo
+    perfil.cuadro()
 
 # --- 5. Salida ---
 pygame.quit()
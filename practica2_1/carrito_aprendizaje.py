@@ -1,119 +1,313 @@
 import tkinter as tk  # Para crear la interfaz gráfica de usuario
 from tkinter import messagebox  # Para mostrar cuadros de mensaje de advertencia o información
-import csv  # Para leer y escribir datos en archivos CSV (en este caso, los movimientos del carrito)
-import time  # Para agregar pausas entre movimientos al reproducir la ruta
+import formato_ruta  # Para guardar y cargar la ruta comprimida (run-length) en JSON
+import optimizador_ruta  # Para eliminar lazos y retrocesos de la ruta enseñada
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))  # perfilado.py está en la raíz del repositorio
+import perfilado  # Perfilado opcional (PERFILADO=1 o --perfil)
 
 # --- Variables Globales (según la estructura original) ---
 ruta = []  # Lista donde guardaremos los movimientos del carrito
-archivo_csv = "ruta_carrito.csv"  # Nombre del archivo CSV donde se guardarán los movimientos
+puntos_paso = []  # Posiciones de la ruta marcadas como puntos de paso (0 = inicio, k = tras k movimientos)
+inicio_ruta = formato_ruta.INICIO  # Esquina del carrito al empezar la ruta en memoria
+paso_ruta = formato_ruta.PASO  # Píxeles por movimiento de la ruta en memoria (la cargada puede usar otro)
+archivo_ruta = "ruta_carrito.json"  # Archivo donde se guarda la ruta comprimida
+archivo_csv = "ruta_carrito.csv"  # Formato anterior (un movimiento por fila), solo se lee
 root = None  # Se inicializará más tarde con tk.Tk()
 canvas = None  # Se inicializará más tarde con tk.Canvas
 carrito = None  # Se inicializará más tarde con canvas.create_rectangle
 
+# Teclas de flecha que mueven el carrito (la dirección de cada una está en formato_ruta.DIRECCIONES)
+MOVIMIENTOS = {"Up", "Down", "Left", "Right"}
+
+# Grabación en memoria: la ruta se guarda en el archivo periódicamente y al cerrar
+ruta_guardada = True  # False si hay movimientos que todavía no se han escrito
+INTERVALO_VOLCADO = 2000  # Milisegundos entre escrituras al archivo
+
+# Estado de la reproducción (se ejecuta con root.after, sin bloquear la ventana)
+reproduccion = []  # Segmentos [movimiento, repeticiones] que se están reproduciendo
+paso_actual = 0  # Índice del segmento que se está reproduciendo
+fotograma = 0  # Fotograma dentro del segmento actual
+origen = formato_ruta.INICIO  # Posición del carrito al empezar el segmento actual
+paso = formato_ruta.PASO  # Píxeles por movimiento de la ruta que se reproduce
+FOTOGRAMAS_SEGMENTO = 6  # Máximo de fotogramas para animar un segmento completo
+retardo_ms = 50  # Pausa entre fotogramas; se ajusta con + y -
+reproduciendo = False
+pausado = False
+id_reproduccion = None  # Identificador del root.after pendiente
+
 def iniciar_aprendizaje(event):
-    """Limpia la ruta anterior, crea el archivo CSV y notifica al usuario."""
-    global ruta, archivo_csv, canvas, carrito
-    
+    """Limpia la ruta anterior, crea el archivo de la ruta y notifica al usuario."""
+    global ruta, ruta_guardada, inicio_ruta, paso_ruta, canvas, carrito
+
     # Muestra instrucciones al usuario
     messagebox.showinfo("Instrucciones", "Vamos a enseñarle a la IA a caminar. Presiona 'A' para comenzar.")
-    
+
+    detener_reproduccion()  # Por si había una reproducción en curso
     ruta.clear()  # Limpiar la lista de movimientos para empezar un nuevo aprendizaje
-    
+    puntos_paso.clear()
+    canvas.delete("punto_paso")
+    ruta_guardada = True
+    inicio_ruta, paso_ruta = formato_ruta.INICIO, formato_ruta.PASO  # Una ruta nueva usa el inicio y paso por defecto
+
     # Reinicia la posición del carrito a la posición inicial
     canvas.coords(carrito, 230, 230, 270, 270)
-    
+
     try:
-        # Crea y sobrescribe el archivo CSV con el encabezado
-        with open(archivo_csv, "w", newline="", encoding="utf-8") as file:
-            writer = csv.writer(file)
-            writer.writerow(["Movimiento", "X", "Y"])  # Escribir la cabecera del CSV
+        # Crea y sobrescribe el archivo con una ruta vacía
+        formato_ruta.guardar(archivo_ruta, [])
     except Exception as e:
-        messagebox.showerror("Error de Archivo", f"No se pudo crear el archivo CSV: {e}")
+        messagebox.showerror("Error de Archivo", f"No se pudo crear el archivo de la ruta: {e}")
 
 def mover_carrito(event):
-    """Mueve el carrito en el canvas y registra el movimiento en la lista y el archivo CSV."""
-    global ruta, archivo_csv, canvas, carrito
-    
+    """Mueve el carrito en el canvas y registra el movimiento en la lista (el archivo se escribe después)."""
+    global ruta, ruta_guardada, canvas, carrito
+
+    if reproduciendo:
+        return  # No se graba mientras se reproduce la ruta
+
     movimiento = event.keysym  # Obtiene la tecla presionada (Up, Down, Left, Right)
-    
-    # Mueve el carrito según la tecla presionada
-    if movimiento == "Up":
-        canvas.move(carrito, 0, -10)  # Mueve el carrito 10 píxeles hacia arriba
-    elif movimiento == "Down":
-        canvas.move(carrito, 0, 10)  # Mueve el carrito 10 píxeles hacia abajo
-    elif movimiento == "Left":
-        canvas.move(carrito, -10, 0)  # Mueve el carrito 10 píxeles hacia la izquierda
-    elif movimiento == "Right":
-        canvas.move(carrito, 10, 0)  # Mueve el carrito 10 píxeles hacia la derecha 
-    else:
+    if movimiento not in MOVIMIENTOS:
         return # Ignora otras teclas
-        
-    # Después de mover el carrito, obtenemos sus nuevas coordenadas (solo x1, y1)
-    x1, y1, x2, y2 = canvas.coords(carrito)
-    
-    ruta.append((movimiento, x1, y1))  # Guardamos el movimiento y las nuevas coordenadas en la lista
-    
-    # Escribimos el movimiento en el archivo CSV (añadiendo)
+
+    with perfil.fase("tecla"):
+        # Mueve el carrito un paso de la ruta (10 píxeles, salvo que la ruta cargada use otro paso)
+        dx, dy = formato_ruta.DIRECCIONES[movimiento]
+        canvas.move(carrito, dx * paso_ruta, dy * paso_ruta)
+
+        # Después de mover el carrito, obtenemos sus nuevas coordenadas (solo x1, y1)
+        x1, y1, x2, y2 = canvas.coords(carrito)
+
+        ruta.append((movimiento, x1, y1))  # Guardamos el movimiento y las nuevas coordenadas en la lista
+        ruta_guardada = False  # Se escribirá en el próximo volcado
+
+def volcar_ruta():
+    """Escribe la ruta comprimida en el archivo si cambió desde el último volcado."""
+    global ruta_guardada
+
+    if ruta_guardada:
+        return
     try:
-        with open(archivo_csv, "a", newline="", encoding="utf-8") as file:
-            writer = csv.writer(file)
-            # Escribe el movimiento y la coordenada superior izquierda (redondeada para mejor lectura)
-            writer.writerow([movimiento, round(x1, 2), round(y1, 2)])
+        with perfil.fase("registro"):
+            formato_ruta.guardar(archivo_ruta, formato_ruta.comprimir(mov for mov, _, _ in ruta),
+                                 inicio_ruta, paso_ruta, puntos_paso)
+        ruta_guardada = True
     except Exception as e:
-        # Imprime un error, pero no detiene la ejecución del movimiento
-        print(f"Error al escribir en CSV: {e}")
-        
-def repetir_movimientos(event):
-    """Reproduce los movimientos guardados en el archivo CSV."""
-    global ruta, root, canvas, carrito
-    
-    if not ruta:  # Si no hay movimientos guardados, muestra un error
-        messagebox.showerror("Error", "No hay movimientos guardados.")
+        # Imprime un error y lo reintenta en el próximo volcado
+        print(f"Error al guardar la ruta: {e}")
+
+def volcado_periodico():
+    """Vuelca la ruta al archivo y se vuelve a programar cada INTERVALO_VOLCADO ms."""
+    volcar_ruta()
+    root.after(INTERVALO_VOLCADO, volcado_periodico)
+
+def cerrar_ventana():
+    """Guarda lo pendiente antes de cerrar la aplicación."""
+    detener_reproduccion()
+    volcar_ruta()
+    root.destroy()
+
+def cargar_ruta():
+    """
+    Lee la ruta desde el archivo JSON (o desde el CSV del formato anterior).
+    Retorna (segmentos, inicio, paso en píxeles).
+    """
+    try:
+        datos = formato_ruta.cargar(archivo_ruta)
+        return datos["segmentos"], datos["inicio"], datos["paso"]
+    except FileNotFoundError:
+        return formato_ruta.cargar_csv(archivo_csv), formato_ruta.INICIO, formato_ruta.PASO
+
+def dibujar_punto_paso(x1, y1):
+    """Dibuja una marca en el centro del carrito para señalar un punto de paso."""
+    cx, cy = x1 + 20, y1 + 20
+    canvas.create_oval(cx - 4, cy - 4, cx + 4, cy + 4, fill="orange", outline="", tags="punto_paso")
+    canvas.tag_raise(carrito)
+
+def marcar_punto_paso(event):
+    """Marca la posición actual del carrito como punto de paso que la ruta optimizada debe respetar."""
+    global ruta_guardada
+
+    if reproduciendo or not ruta:
         return
-        
-    respuesta = messagebox.askyesno("Confirmación", "¿Estás seguro que es todo por enseñarle?")
-    
-    if respuesta:  # Si el usuario confirma, reproduce los movimientos guardados
+    if not puntos_paso or puntos_paso[-1] != len(ruta):
+        puntos_paso.append(len(ruta))
+        dibujar_punto_paso(ruta[-1][1], ruta[-1][2])
+        ruta_guardada = False
+
+def optimizar_ruta(event):
+    """Reemplaza la ruta enseñada por la más corta que pasa por los mismos puntos de paso."""
+    global ruta, puntos_paso, inicio_ruta, paso_ruta, ruta_guardada
+
+    if reproduciendo:
+        return
+
+    if not ruta:
+        # Sin ruta en memoria: optimizar la guardada en el archivo
         try:
-            ruta_reproducir = []
-            
-            # 1. Leer la ruta completa desde el archivo CSV
-            with open(archivo_csv, "r", encoding="utf-8") as file:  # Abre el archivo CSV en modo lectura
-                reader = csv.reader(file)
-                next(reader)  # Salta el encabezado
-                
-                # Almacena solo el movimiento (primera columna)
-                for row in reader:
-                    ruta_reproducir.append(row[0])
-            
-            # 2. Reinicia la posición del carrito a la posición inicial
-            canvas.coords(carrito, 230, 230, 270, 270)
-            root.update()  # Actualiza la ventana para mostrar el reinicio
-            
-            # 3. Reproduce los movimientos guardados uno por uno
-            for mov in ruta_reproducir:
-                time.sleep(0.05)  # Pausa de 0.05 segundos entre movimientos
-                root.update()  # Actualiza la ventana para ver el movimiento
-                
-                # Aplica el movimiento
-                if mov == "Up":
-                    canvas.move(carrito, 0, -10)
-                elif mov == "Down":
-                    canvas.move(carrito, 0, 10)
-                elif mov == "Left":
-                    canvas.move(carrito, -10, 0)
-                elif mov == "Right":
-                    canvas.move(carrito, 10, 0)
-                    
-            messagebox.showinfo("Éxito", "¡El carrito ha repetido la ruta aprendida!")
+            datos = formato_ruta.cargar(archivo_ruta)
+            inicio_ruta, paso_ruta = tuple(datos["inicio"]), datos["paso"]
+            ruta = formato_ruta.posiciones(datos["segmentos"], inicio_ruta, paso_ruta)
+            puntos_paso = datos["puntos_paso"]
+        except FileNotFoundError:
+            inicio_ruta, paso_ruta = formato_ruta.INICIO, formato_ruta.PASO
+            ruta = formato_ruta.posiciones(formato_ruta.cargar_csv(archivo_csv))
+            puntos_paso = []
+        except Exception as e:
+            messagebox.showerror("Error", f"No se pudo leer la ruta: {e}")
+            return
+        if not ruta:
+            messagebox.showerror("Error", "No hay movimientos guardados.")
+            return
+
+    try:
+        with perfil.fase("optimizacion"):  # Solo el cálculo; los diálogos quedan fuera de la medición
+            ruta_optimizada, reporte = optimizador_ruta.optimizar_ruta(ruta, puntos_paso,
+                                                                        inicio=inicio_ruta, paso=paso_ruta)
+    except ValueError as e:
+        messagebox.showerror("Error de Optimización", str(e))
+        return
 
+    ruta = ruta_optimizada
+    puntos_paso = reporte["puntos_paso"]
+    ruta_guardada = False  # Se guarda en el próximo volcado
+
+    # Deja el carrito al final de la nueva ruta y redibuja los puntos de paso
+    with perfil.fase("dibujo"):
+        _, x1, y1 = ruta[-1] if ruta else (None, *inicio_ruta)
+        canvas.coords(carrito, x1, y1, x1 + 40, y1 + 40)
+        canvas.delete("punto_paso")
+        celdas = [inicio_ruta] + [(x, y) for _, x, y in ruta]  # Esquina del carrito en cada posición
+        for posicion in puntos_paso:
+            if 0 <= posicion < len(celdas):
+                dibujar_punto_paso(*celdas[posicion])
+
+    messagebox.showinfo("Ruta Optimizada", optimizador_ruta.texto_reporte(reporte))
+
+def repetir_movimientos(event):
+    """Reproduce la ruta aprendida (desde memoria, o desde el archivo si la memoria está vacía)."""
+    global reproduccion, paso_actual, fotograma, origen, paso, reproduciendo, pausado
+
+    if reproduciendo:
+        return  # Ya hay una reproducción en curso
+
+    if ruta:
+        # 1. Usar directamente la ruta en memoria, sin pasar por el archivo
+        segmentos = formato_ruta.comprimir(mov for mov, _, _ in ruta)
+        inicio, paso_segmentos = inicio_ruta, paso_ruta
+    else:
+        # 1. Sin ruta en memoria: leerla desde el archivo
+        try:
+            segmentos, inicio, paso_segmentos = cargar_ruta()
         except FileNotFoundError:
             messagebox.showerror("Error", "No hay ruta guardada para reproducir (archivo no encontrado).")
+            return
         except Exception as e:
-             messagebox.showerror("Error de Reproducción", f"Ocurrió un error: {e}")
+            messagebox.showerror("Error de Reproducción", f"Ocurrió un error: {e}")
+            return
+
+    if not segmentos:  # Si no hay movimientos guardados, muestra un error
+        messagebox.showerror("Error", "No hay movimientos guardados.")
+        return
+
+    respuesta = messagebox.askyesno("Confirmación", "¿Estás seguro que es todo por enseñarle?")
+
+    if respuesta:  # Si el usuario confirma, reproduce los movimientos guardados
+        # 2. Reinicia la posición del carrito a la posición inicial
+        x, y = inicio
+        canvas.coords(carrito, x, y, x + 40, y + 40)
+
+        # 3. Programa el primer fotograma; los siguientes se encadenan con root.after
+        reproduccion = segmentos
+        paso_actual = 0
+        fotograma = 0
+        origen = inicio
+        paso = paso_segmentos
+        reproduciendo = True
+        pausado = False
+        programar_paso()
+
+def programar_paso():
+    """Programa el siguiente fotograma de la reproducción según la velocidad actual."""
+    global id_reproduccion
+    id_reproduccion = root.after(retardo_ms, paso_reproduccion)
+
+def paso_reproduccion():
+    """
+    Dibuja un fotograma del segmento actual y programa el siguiente.
+    Cada segmento (un movimiento repetido N veces) se anima como un solo desplazamiento
+    interpolado en, como máximo, FOTOGRAMAS_SEGMENTO fotogramas.
+    """
+    global paso_actual, fotograma, origen, reproduciendo, id_reproduccion
+
+    mov, veces = reproduccion[paso_actual]
+    dx, dy = formato_ruta.DIRECCIONES[mov]
+    fotogramas = min(veces, FOTOGRAMAS_SEGMENTO)
+    fotograma += 1
+
+    with perfil.fase("reproduccion"):
+        # Posición interpolada a partir del origen del segmento (sin acumular errores)
+        avance = veces * paso * fotograma / fotogramas
+        x = origen[0] + dx * avance
+        y = origen[1] + dy * avance
+        canvas.coords(carrito, x, y, x + 40, y + 40)
+
+    if fotograma == fotogramas:  # Segmento terminado: pasar al siguiente
+        origen = (x, y)
+        paso_actual += 1
+        fotograma = 0
+
+    if paso_actual < len(reproduccion):
+        programar_paso()
+    else:
+        reproduciendo = False
+        id_reproduccion = None
+        messagebox.showinfo("Éxito", "¡El carrito ha repetido la ruta aprendida!")
+
+def pausar_reproduccion(event):
+    """Pausa o reanuda la reproducción en curso."""
+    global pausado, id_reproduccion
+
+    if not reproduciendo:
+        return
+    if pausado:
+        pausado = False
+        programar_paso()
+    else:
+        pausado = True
+        root.after_cancel(id_reproduccion)
+        id_reproduccion = None
+
+def detener_reproduccion():
+    """Cancela la reproducción en curso, si la hay."""
+    global reproduciendo, pausado, id_reproduccion
+
+    if id_reproduccion is not None:
+        root.after_cancel(id_reproduccion)
+    id_reproduccion = None
+    reproduciendo = False
+    pausado = False
+
+def cancelar_reproduccion(event):
+    """Cancela la reproducción con la tecla Escape."""
+    detener_reproduccion()
+
+def cambiar_velocidad(event):
+    """'+' acelera la reproducción y '-' la hace más lenta."""
+    global retardo_ms
+
+    if event.keysym in ("plus", "KP_Add"):
+        retardo_ms = max(5, retardo_ms // 2)
+    else:
+        retardo_ms = min(1000, retardo_ms * 2)
+    root.title(f"Simulación de Carrito IA - {retardo_ms} ms por fotograma")
 
 # --- Bloque Principal de Ejecución ---
 
+# 0. Perfilado opcional (PERFILADO=1 o --perfil)
+perfil = perfilado.crear("carrito_aprendizaje")
+
 # 1. Crea la ventana principal e inicializa las variables globales
 root = tk.Tk()  # Crea la ventana principal
 root.title("Simulación de Carrito IA")  # Asigna el título a la ventana
@@ -132,6 +326,18 @@ root.bind("<Down>", mover_carrito)  # Al presionar "Down", mueve el carrito haci
 root.bind("<Left>", mover_carrito)  # Al presionar "Left", mueve el carrito hacia la izquierda
 root.bind("<Right>", mover_carrito)  # Al presionar "Right", mueve el carrito hacia la derecha
 root.bind("i", repetir_movimientos)  # Al presionar "I", repite los movimientos guardados
+root.bind("m", marcar_punto_paso)  # Al presionar "M", marca un punto de paso
+root.bind("o", optimizar_ruta)  # Al presionar "O", optimiza la ruta aprendida
+root.bind("p", pausar_reproduccion)  # Al presionar "P", pausa o reanuda la reproducción
+root.bind("<Escape>", cancelar_reproduccion)  # Al presionar "Esc", cancela la reproducción
+root.bind("<plus>", cambiar_velocidad)  # Al presionar "+", reproduce más rápido
+root.bind("<KP_Add>", cambiar_velocidad)
+root.bind("<minus>", cambiar_velocidad)  # Al presionar "-", reproduce más lento
+root.bind("<KP_Subtract>", cambiar_velocidad)
+
+# 5. Guarda la ruta periódicamente y también al cerrar la ventana
+root.protocol("WM_DELETE_WINDOW", cerrar_ventana)
+root.after(INTERVALO_VOLCADO, volcado_periodico)
 
-# 5. Inicia el ciclo de la interfaz gráfica
-root.mainloop()  # Inicia el ciclo de la interfaz 
\ No newline at end of file
+# 6. Inicia el ciclo de la interfaz gráfica
+root.mainloop()  # Inicia el ciclo de la interfaz
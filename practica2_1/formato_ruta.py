@@ -0,0 +1,72 @@
+import json  # Para guardar la ruta comprimida en un archivo pequeño
+import csv  # Para leer rutas antiguas guardadas en CSV
+import os  # Para reemplazar el archivo de forma segura
+
+PASO = 10  # Píxeles que avanza el carrito en cada movimiento
+INICIO = (230, 230)  # Esquina superior izquierda del carrito al empezar
+
+# Dirección unitaria (dx, dy) de cada movimiento
+DIRECCIONES = {"Up": (0, -1), "Down": (0, 1), "Left": (-1, 0), "Right": (1, 0)}
+
+def comprimir(movimientos):
+    """
+    Codifica por longitud de racha (run-length) una lista de movimientos.
+    ["Up", "Up", "Up", "Left"] -> [["Up", 3], ["Left", 1]]
+    """
+    segmentos = []
+    for mov in movimientos:
+        if segmentos and segmentos[-1][0] == mov:
+            segmentos[-1][1] += 1
+        else:
+            segmentos.append([mov, 1])
+    return segmentos
+
+def expandir(segmentos):
+    """Operación inversa de comprimir: devuelve la lista de movimientos individuales."""
+    return [mov for mov, veces in segmentos for _ in range(veces)]
+
+def posiciones(segmentos, inicio=INICIO, paso=PASO):
+    """Reconstruye la ruta como [(movimiento, x1, y1), ...], igual que la lista `ruta` del carrito."""
+    x, y = inicio
+    ruta = []
+    for mov, veces in segmentos:
+        dx, dy = DIRECCIONES[mov]
+        for _ in range(veces):
+            x += dx * paso
+            y += dy * paso
+            ruta.append((mov, float(x), float(y)))
+    return ruta
+
+def guardar(archivo, segmentos, inicio=INICIO, paso=PASO, puntos_paso=()):
+    """
+    Guarda la ruta comprimida como JSON: {"inicio": [x, y], "paso": 10, "segmentos": [["Up", 3], ...]}.
+    Si hay puntos de paso marcados, se guardan en "puntos_paso" como posiciones a lo largo
+    de la ruta (0 = celda inicial, k = celda después de k movimientos).
+    Se escribe primero a un archivo temporal para no dejar el archivo a medias si algo falla.
+    """
+    datos = {"inicio": list(inicio), "paso": paso, "segmentos": segmentos}
+    if puntos_paso:
+        datos["puntos_paso"] = list(puntos_paso)
+    temporal = archivo + ".tmp"
+    with open(temporal, "w", encoding="utf-8") as file:
+        json.dump(datos, file, separators=(",", ":"))
+    os.replace(temporal, archivo)
+
+def cargar(archivo):
+    """Lee una ruta comprimida y devuelve el diccionario con inicio, paso y segmentos."""
+    with open(archivo, "r", encoding="utf-8") as file:
+        datos = json.load(file)
+    for mov, veces in datos["segmentos"]:
+        if mov not in DIRECCIONES or veces < 1:
+            raise ValueError(f"Segmento inválido en la ruta: {mov} x {veces}")
+    datos["inicio"] = tuple(datos.get("inicio", INICIO))
+    datos.setdefault("paso", PASO)
+    datos.setdefault("puntos_paso", [])
+    return datos
+
+def cargar_csv(archivo):
+    """Lee una ruta en el formato CSV anterior (Movimiento, X, Y) y la devuelve comprimida."""
+    with open(archivo, "r", encoding="utf-8") as file:
+        reader = csv.reader(file)
+        next(reader, None)  # Salta el encabezado
+        return comprimir(row[0] for row in reader if row and row[0] in DIRECCIONES)
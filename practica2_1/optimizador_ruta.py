@@ -0,0 +1,165 @@
+import heapq  # Para usar colas de prioridad (esencial para A*)
+import sys  # Para leer el archivo de la ruta desde la línea de comandos
+import formato_ruta  # Para leer, comprimir y guardar rutas del carrito
+
+# Tamaño del lienzo y del carrito en carrito_aprendizaje.py
+ANCHO_LIENZO, ALTO_LIENZO, TAM_CARRITO = 500, 500, 40
+
+def a_celda(x, y, inicio=formato_ruta.INICIO, paso=formato_ruta.PASO):
+    """Convierte la esquina (x, y) del carrito en una celda (fila, columna) relativa al inicio."""
+    return round((y - inicio[1]) / paso), round((x - inicio[0]) / paso)
+
+def celdas_recorridas(ruta, inicio=formato_ruta.INICIO, paso=formato_ruta.PASO):
+    """Retorna la secuencia de celdas de la ruta [(movimiento, x1, y1), ...], empezando por la inicial."""
+    return [(0, 0)] + [a_celda(x, y, inicio, paso) for _, x, y in ruta]
+
+def heuristica(nodo, meta):
+    """Calcula la distancia de Manhattan (h) desde un nodo hasta la meta."""
+    return abs(nodo[0] - meta[0]) + abs(nodo[1] - meta[1])
+
+def buscar_camino(inicio, fin, transitable):
+    """
+    Implementa el algoritmo A* (como en laberinto_astar.py) sobre la rejilla de celdas.
+    `transitable(celda)` indica si se puede pasar por una celda.
+    """
+    # open_list: (f_score, g_score, nodo)
+    open_list = [(heuristica(inicio, fin), 0, inicio)]
+    # g_score: costo real desde el inicio hasta el nodo
+    g_score = {inicio: 0}
+    # came_from: guarda el nodo anterior para reconstruir el camino
+    came_from = {}
+
+    while open_list:
+        # Obtiene el nodo con el menor f_score (f = g + h)
+        _, g_current, current_node = heapq.heappop(open_list)
+
+        if current_node == fin:
+            # Reconstruir camino:
+            path = []
+            while current_node in came_from:
+                path.append(current_node)
+                current_node = came_from[current_node]
+            path.append(inicio)
+            return path[::-1] # Retorna la lista de nodos en orden de inicio a fin
+
+        if g_current > g_score[current_node]:
+            continue # Entrada vieja de la cola: ya se encontró un camino mejor
+
+        i, j = current_node
+
+        # Explora vecinos (arriba, abajo, izquierda, derecha)
+        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+            neighbor = (i + dx, j + dy)
+            if not transitable(neighbor):
+                continue
+
+            tentative_g_score = g_current + 1
+
+            # Si encontramos una ruta mejor al vecino
+            if tentative_g_score < g_score.get(neighbor, float('inf')):
+                came_from[neighbor] = current_node # Guarda el paso anterior
+                g_score[neighbor] = tentative_g_score # Actualiza el costo real
+                f_score = tentative_g_score + heuristica(neighbor, fin)
+                heapq.heappush(open_list, (f_score, tentative_g_score, neighbor))
+
+    return []  # No se encontró camino
+
+def camino_a_movimientos(camino):
+    """Convierte una lista de celdas contiguas en movimientos Up/Down/Left/Right."""
+    nombres = {(df, dc): mov for mov, (dc, df) in formato_ruta.DIRECCIONES.items()}
+    return [nombres[(b[0] - a[0], b[1] - a[1])] for a, b in zip(camino, camino[1:])]
+
+def optimizar_ruta(ruta, puntos_paso=(), obstaculos=(), solo_visitadas=True,
+                   inicio=formato_ruta.INICIO, paso=formato_ruta.PASO):
+    """
+    Calcula la ruta más corta que pasa, en orden, por el inicio, los puntos de paso y el final
+    de la ruta enseñada, eliminando lazos y retrocesos.
+
+    - ruta: lista [(movimiento, x1, y1), ...] como la del carrito.
+    - puntos_paso: posiciones a lo largo de la ruta que deben visitarse en orden
+      (0 = celda inicial, k = celda después de k movimientos, es decir la de ruta[k - 1]).
+    - obstaculos: celdas (fila, columna) por las que no se puede pasar.
+    - solo_visitadas: si es True solo se usan celdas por las que pasó el carrito
+      (terreno conocido); si es False se puede usar cualquier celda del lienzo.
+
+    Retorna (ruta_optimizada, reporte). El reporte incluye los pasos ahorrados y
+    las posiciones de los puntos de paso dentro de la ruta optimizada (mismo formato;
+    sin repetidos, y 0 si un punto de paso cae en la celda inicial).
+    """
+    celdas = celdas_recorridas(ruta, inicio, paso)
+    obstaculos = set(obstaculos)
+
+    if solo_visitadas:
+        permitidas = set(celdas)
+        transitable = lambda celda: celda in permitidas and celda not in obstaculos
+    else:
+        # Límites del lienzo en celdas relativas al inicio (ampliados si la ruta se salió de él)
+        fila_min, col_min = a_celda(0, 0, inicio, paso)
+        fila_max, col_max = a_celda(ANCHO_LIENZO - TAM_CARRITO, ALTO_LIENZO - TAM_CARRITO, inicio, paso)
+        fila_min, fila_max = min(fila_min, *(f for f, _ in celdas)), max(fila_max, *(f for f, _ in celdas))
+        col_min, col_max = min(col_min, *(c for _, c in celdas)), max(col_max, *(c for _, c in celdas))
+        transitable = lambda celda: (fila_min <= celda[0] <= fila_max and col_min <= celda[1] <= col_max
+                                     and celda not in obstaculos)
+
+    # Objetivos en orden: inicio, puntos de paso y final (celdas[k] es la posición k de la ruta)
+    posiciones = sorted(set(puntos_paso))
+    if posiciones and not 0 <= posiciones[0] <= posiciones[-1] < len(celdas):
+        raise ValueError(f"Puntos de paso fuera de la ruta (posiciones válidas: 0 a {len(celdas) - 1}).")
+    objetivos = [celdas[0]] + [celdas[k] for k in posiciones] + [celdas[-1]]
+    for celda in objetivos:
+        if celda in obstaculos:
+            raise ValueError(f"El punto {celda} está dentro de un obstáculo.")
+
+    camino = [objetivos[0]]
+    posiciones_puntos = []
+    for origen, destino in zip(objetivos, objetivos[1:]):
+        tramo = buscar_camino(origen, destino, transitable)
+        if not tramo:
+            raise ValueError(f"No hay camino entre {origen} y {destino} con las restricciones dadas.")
+        camino.extend(tramo[1:])
+        posiciones_puntos.append(len(camino) - 1)  # Posición del objetivo en el camino (0 = inicio)
+    # El último objetivo es el final, no un punto de paso; dos puntos en la misma celda quedan en uno
+    posiciones_puntos = sorted(set(posiciones_puntos[:-1]))
+
+    movimientos = camino_a_movimientos(camino)
+    segmentos = formato_ruta.comprimir(movimientos)
+    ruta_optimizada = formato_ruta.posiciones(segmentos, inicio, paso)
+
+    reporte = {
+        "pasos_originales": len(ruta),
+        "pasos_optimizados": len(movimientos),
+        "pasos_ahorrados": len(ruta) - len(movimientos),
+        "porcentaje_ahorrado": 100 * (len(ruta) - len(movimientos)) / len(ruta) if ruta else 0.0,
+        "segmentos_originales": len(formato_ruta.comprimir(mov for mov, _, _ in ruta)),
+        "segmentos_optimizados": len(segmentos),
+        "celdas_visitadas": len(set(celdas)),
+        "puntos_paso": posiciones_puntos,
+    }
+    return ruta_optimizada, reporte
+
+def texto_reporte(reporte):
+    """Formatea el reporte de optimizar_ruta para mostrarlo al usuario."""
+    return (f"Pasos: {reporte['pasos_originales']} -> {reporte['pasos_optimizados']} "
+            f"(ahorro de {reporte['pasos_ahorrados']}, {reporte['porcentaje_ahorrado']:.1f}%)\n"
+            f"Segmentos: {reporte['segmentos_originales']} -> {reporte['segmentos_optimizados']}\n"
+            f"Celdas visitadas: {reporte['celdas_visitadas']}")
+
+# --- Ejecución desde la línea de comandos ---
+if __name__ == "__main__":
+    # Uso: python optimizador_ruta.py [ruta_carrito.json] [ruta_optimizada.json]
+    entrada = sys.argv[1] if len(sys.argv) > 1 else "ruta_carrito.json"
+    salida = sys.argv[2] if len(sys.argv) > 2 else "ruta_optimizada.json"
+
+    if entrada.endswith(".csv"):
+        datos = {"segmentos": formato_ruta.cargar_csv(entrada), "inicio": formato_ruta.INICIO,
+                 "paso": formato_ruta.PASO, "puntos_paso": []}
+    else:
+        datos = formato_ruta.cargar(entrada)
+
+    ruta = formato_ruta.posiciones(datos["segmentos"], datos["inicio"], datos["paso"])
+    ruta_optimizada, reporte = optimizar_ruta(ruta, datos["puntos_paso"],
+                                              inicio=datos["inicio"], paso=datos["paso"])
+    formato_ruta.guardar(salida, formato_ruta.comprimir(mov for mov, _, _ in ruta_optimizada),
+                         datos["inicio"], datos["paso"], reporte["puntos_paso"])
+    print(texto_reporte(reporte))
+    print(f"Ruta optimizada guardada en: {salida}")
@@ -1,10 +1,23 @@
-import tkinter as tk  # Para crear la ventana y los gráficos
+import argparse  # Para las opciones de la línea de comandos
+import colorsys  # Para dar un color distinto a cada agente
 import csv  # Para guardar datos en archivos CSV
 import heapq  # Para usar colas de prioridad (esencial para A*)
+import random  # Para elegir inicios y metas de varios agentes
+import time  # Para medir el tiempo de planificación
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))  # perfilado.py está en la raíz del repositorio
+import perfilado  # Perfilado opcional (PERFILADO=1 o --perfil)
+from practica2_3 import busqueda  # Búsqueda de un solo agente (A*), compartida con la práctica 2.3
+
+perfil = perfilado.INACTIVO  # main() crea el perfilador real
+# tkinter se importa solo al abrir la ventana, así el algoritmo se puede usar sin pantalla
 
 TAM_CELDA = 40  # Cada celda del laberinto será un cuadrado de 40x40 píxeles
+TAM_VENTANA = 800  # En laberintos grandes las celdas se achican para que el lienzo quepa en pantalla
+RETARDO_AGENTES = 150  # Milisegundos entre ticks al animar varios agentes
 # Definición del laberinto (matriz de 19x16)
-# (1 = pared, 0 = camino, A = inicio, B = fin)
+# (1 = pared, 0 = camino, 2-9 = terreno con ese costo, A = inicio, B = fin)
 laberinto = [
     ["1", "1", "1", "1", "1", "1", "1", "1", "1", "1", "1", "1", "1", "1", "1", "1"],
     ["1", "A", "0", "0", "1", "0", "0", "0", "1", "0", "0", "0", "1", "0", "B", "1"],
@@ -27,8 +40,319 @@ laberinto = [
     ["1", "1", "1", "1", "1", "1", "1", "1", "1", "1", "1", "1", "1", "1", "1", "1"]
 ]
 
+# Color del terreno según su costo (más oscuro = más caro)
+COLORES_TERRENO = {2: "#f7ecc9", 3: "#f3e2b3", 4: "#ebd196", 5: "#d9b26f",
+                   6: "#c99f5f", 7: "#b88c55", 8: "#a97f4f", 9: "#a0764a"}
+
+# --- Varios agentes: A* cooperativo sobre (celda, tiempo) ---
+
+MOVIMIENTOS = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Arriba, abajo, izquierda, derecha
+
+def costo_agente(celda):
+    """Costo de entrar a una celda: 1 para camino, inicio o meta, 2-9 para terreno, None si es pared."""
+    if celda in ("0", "A", "B"):
+        return 1
+    if celda in "23456789":
+        return int(celda)
+    return None  # Pared (1)
+
+def grafo_vecinos(lab):
+    """Para cada celda transitable, la lista de (vecino, costo de entrar al vecino)."""
+    alto, ancho = len(lab), len(lab[0])
+    vecinos = {}
+    for i in range(alto):
+        for j in range(ancho):
+            if costo_agente(lab[i][j]) is None:
+                continue
+            vecinos[(i, j)] = [((i + di, j + dj), costo_agente(lab[i + di][j + dj]))
+                               for di, dj in MOVIMIENTOS
+                               if 0 <= i + di < alto and 0 <= j + dj < ancho
+                               and costo_agente(lab[i + di][j + dj]) is not None]
+    return vecinos
+
+def distancias_reales(lab, meta, vecinos=None):
+    """
+    Dijkstra inverso desde la meta: costo mínimo real de cada celda alcanzable hasta `meta`,
+    ignorando a los demás agentes. Es la heurística exacta del A* cooperativo.
+    """
+    vecinos = grafo_vecinos(lab) if vecinos is None else vecinos
+    distancias = {meta: 0}
+    cola = [(0, meta)]
+    while cola:
+        d, celda = heapq.heappop(cola)
+        if d > distancias[celda]:
+            continue
+        d += costo_agente(lab[celda[0]][celda[1]])  # Lo que cuesta entrar a la celda desde un vecino
+        for vecino, _ in vecinos[celda]:
+            if d < distancias.get(vecino, float('inf')):
+                distancias[vecino] = d
+                heapq.heappush(cola, (d, vecino))
+    return distancias
+
+def costo_plan(lab, plan):
+    """Costo de un plan por ticks: moverse cuesta el terreno de destino y esperar cuesta 1."""
+    return sum(1 if a == b else costo_agente(lab[b[0]][b[1]]) for a, b in zip(plan, plan[1:]))
+
+class PlanificadorCooperativo:
+    """
+    A* cooperativo: planifica los agentes uno por uno sobre estados (celda, tiempo) y guarda
+    cada plan en una tabla de reservas compartida (celdas por tick, cruces entre celdas y metas
+    ocupadas desde la llegada), para que los agentes siguientes lo eviten.
+
+    Cada acción (moverse a un vecino o esperar) dura un tick. Moverse cuesta el terreno de la
+    celda destino y esperar cuesta 1. La heurística de cada meta es la distancia real sin
+    agentes (un Dijkstra inverso), que se guarda por meta. Con metas distintas se calcula una
+    vez por agente y la reutilizan camino_independiente y la planificación de ese agente; entre
+    agentes solo se ahorra si comparten meta, lo que aquí no ocurre porque cada agente ocupa
+    su meta para siempre al llegar.
+    """
+    def __init__(self, lab, margen=None, max_expansiones=None):
+        self.lab = lab
+        self.alto, self.ancho = len(lab), len(lab[0])
+        # Ticks extra (además de la distancia real) que un agente puede esperar o desviarse
+        self.margen = self.alto + self.ancho if margen is None else margen
+        # Expansiones máximas por agente: evita explorar todo el espacio-tiempo cuando no hay plan
+        self.max_expansiones = 10 * self.alto * self.ancho if max_expansiones is None else max_expansiones
+        # Acciones posibles desde cada celda: moverse a un vecino o esperar (costo 1)
+        self.vecinos = grafo_vecinos(lab)
+        self.acciones = {celda: lista + [(celda, 1)] for celda, lista in self.vecinos.items()}
+        self.heuristicas = {}  # meta -> distancias_reales
+        self.celdas = set()  # (celda, t) reservadas
+        self.cruces = set()  # (desde, hacia, t): movimiento reservado entre t y t + 1
+        self.ultima_reserva = {}  # celda -> último tick en que está reservada
+        self.metas = {}  # celda -> tick desde el que un agente se queda ahí para siempre
+        self.expansiones = 0
+
+    def heuristica(self, meta):
+        """Distancias reales hasta `meta` (se calculan la primera vez que se piden)."""
+        distancias = self.heuristicas.get(meta)
+        if distancias is None:
+            distancias = self.heuristicas[meta] = distancias_reales(self.lab, meta, self.vecinos)
+        return distancias
+
+    def reservar_inicios(self, inicios):
+        """Reserva la posición de todos los agentes en el tick 0, antes de planificar."""
+        for celda in inicios:
+            self.celdas.add((celda, 0))
+            self.ultima_reserva.setdefault(celda, 0)
+
+    def planificar(self, inicio, meta):
+        """
+        Busca el plan de menor costo que no choca con las reservas.
+        Retorna la celda de cada tick [inicio, ..., meta], o [] si no hay plan dentro del margen
+        (o si se agotan las expansiones permitidas).
+        """
+        h = self.heuristica(meta)
+        if inicio not in h:
+            return []  # La meta no es alcanzable desde el inicio
+        limite = h[inicio] + self.margen
+        celdas, cruces, metas = self.celdas, self.cruces, self.metas
+        tope = self.expansiones + self.max_expansiones
+        # La meta queda libre recién en este tick; como cada tick cuesta al menos 1,
+        # max(h, ticks que faltan para ese momento) sigue siendo una cota admisible
+        libre_desde = self.ultima_reserva.get(meta, -1) + 1
+
+        # open_list: (f_score, -g_score, t, celda); a igual f se expande primero el más avanzado,
+        # que con la heurística exacta suele llegar a la meta sin abrir caminos alternativos
+        open_list = [(max(h[inicio], libre_desde), 0, 0, inicio)]
+        g_score = {(inicio, 0): 0}
+        came_from = {}
+        while open_list:
+            _, g_current, t, celda = heapq.heappop(open_list)
+            g_current = -g_current
+            if g_current > g_score[(celda, t)]:
+                continue  # Entrada vieja de la cola
+            self.expansiones += 1
+            if self.expansiones > tope:
+                return []
+
+            # Solo puede terminar si nadie pasa por la meta después de su llegada
+            if celda == meta and t > self.ultima_reserva.get(meta, -1):
+                plan = [celda]
+                estado = (celda, t)
+                while estado in came_from:
+                    estado = came_from[estado]
+                    plan.append(estado[0])
+                return plan[::-1]
+            if t >= limite:
+                continue
+
+            for vecino, costo in self.acciones[celda]:
+                # Celda ocupada en t + 1 (por un plan o por un agente ya en su meta),
+                # o intercambio de lugares con otro agente
+                if ((vecino, t + 1) in celdas or t + 1 >= metas.get(vecino, limite + 1)
+                        or (vecino, celda, t) in cruces):
+                    continue
+                tentative_g_score = g_current + costo
+                if tentative_g_score < g_score.get((vecino, t + 1), float('inf')):
+                    came_from[(vecino, t + 1)] = (celda, t)
+                    g_score[(vecino, t + 1)] = tentative_g_score
+                    f_score = tentative_g_score + max(h[vecino], libre_desde - t - 1)
+                    heapq.heappush(open_list, (f_score, -tentative_g_score, t + 1, vecino))
+        return []
+
+    def reservar(self, plan):
+        """Agrega un plan a la tabla de reservas; el agente queda en su meta al terminar."""
+        for t, celda in enumerate(plan):
+            self.celdas.add((celda, t))
+            self.ultima_reserva[celda] = max(t, self.ultima_reserva.get(celda, -1))
+            if t:
+                self.cruces.add((plan[t - 1], celda, t - 1))
+        self.metas[plan[-1]] = len(plan) - 1
+
+    def camino_independiente(self, inicio, meta):
+        """Camino óptimo sin tener en cuenta a los demás agentes (bajando por la heurística exacta)."""
+        h = self.heuristica(meta)
+        if inicio not in h:
+            return []
+        camino = [inicio]
+        while camino[-1] != meta:
+            i, j = camino[-1]
+            vecinos = [(i + di, j + dj) for di, dj in MOVIMIENTOS if (i + di, j + dj) in h]
+            camino.append(min(vecinos, key=lambda v: h[v] + costo_agente(self.lab[v[0]][v[1]])))
+        return camino
+
+def contar_conflictos(planes):
+    """
+    Cuenta los choques entre planes por ticks: dos agentes en la misma celda en el mismo tick,
+    o dos agentes que intercambian lugares. Al terminar, cada agente se queda en su meta.
+    """
+    planes = [plan for plan in planes if plan]
+    duracion = max((len(plan) for plan in planes), default=0)
+    conflictos = 0
+    for t in range(duracion):
+        ocupacion = {}
+        for plan in planes:
+            celda = plan[min(t, len(plan) - 1)]
+            ocupacion[celda] = ocupacion.get(celda, 0) + 1
+        conflictos += sum(n * (n - 1) // 2 for n in ocupacion.values())
+        if t + 1 < duracion:
+            movimientos = set()
+            for plan in planes:
+                a, b = plan[min(t, len(plan) - 1)], plan[min(t + 1, len(plan) - 1)]
+                if a != b:
+                    movimientos.add((a, b))
+            conflictos += sum(1 for a, b in movimientos if (b, a) in movimientos) // 2
+    return conflictos
+
+def orden_planificacion(agentes, independientes):
+    """
+    Ordena los agentes para planificar al final aquellos cuya meta queda en el camino de otros.
+    Un agente detenido en su meta bloquea esa celda para los que se planifican después; si se
+    planifica más tarde, en cambio, espera a que los demás pasen antes de llegar.
+    """
+    metas = {meta: k for k, (_, meta) in enumerate(agentes)}
+    bloqueos = [0] * len(agentes)  # Cuántos otros agentes pasan por la meta de cada agente
+    for otro, camino in enumerate(independientes):
+        for celda in set(camino):
+            k = metas.get(celda)
+            if k is not None and k != otro:
+                bloqueos[k] += 1
+    return sorted(range(len(agentes)), key=lambda k: bloqueos[k])
+
+def planificar_agentes(lab, agentes, margen=None, max_expansiones=None):
+    """
+    Planifica en lote una lista de agentes [(inicio, meta), ...] con A* cooperativo
+    (en el orden de orden_planificacion). Retorna (planes, reporte) con los planes en el
+    orden de `agentes`; el plan de un agente sin solución es [].
+    """
+    planificador = PlanificadorCooperativo(lab, margen, max_expansiones)
+    t0 = time.perf_counter()
+    # Caminos de cada agente por su cuenta: sirven para ordenar y para contar los conflictos
+    independientes = [planificador.camino_independiente(inicio, meta) for inicio, meta in agentes]
+    planificador.reservar_inicios(inicio for inicio, _ in agentes)
+    planes = [[] for _ in agentes]
+    for k in orden_planificacion(agentes, independientes):
+        planes[k] = planificador.planificar(*agentes[k])
+        if planes[k]:
+            planificador.reservar(planes[k])
+    segundos = time.perf_counter() - t0
+
+    # Los conflictos resueltos son los que tendría el plan ingenuo entre los agentes planificados;
+    # los que involucran a agentes sin plan se informan aparte
+    planificados = [plan for plan in planes if plan]
+    resueltos = contar_conflictos([camino for camino, plan in zip(independientes, planes) if plan])
+    reporte = {
+        "agentes": len(agentes),
+        "planificados": len(planificados),
+        "sin_plan": len(agentes) - len(planificados),
+        "segundos": segundos,
+        "agentes_por_segundo": len(agentes) / segundos if segundos else float('inf'),
+        "expansiones": planificador.expansiones,
+        "heuristicas": len(planificador.heuristicas),
+        "conflictos_resueltos": resueltos,
+        "conflictos_sin_plan": contar_conflictos(independientes) - resueltos,
+        "conflictos_restantes": contar_conflictos(planificados),
+        "costo_total": sum(costo_plan(lab, plan) for plan in planificados),
+        "ticks": max((len(plan) - 1 for plan in planificados), default=0),
+    }
+    return planes, reporte
+
+def texto_reporte(reporte):
+    """Formatea el reporte de planificar_agentes para mostrarlo al usuario."""
+    texto = (f"Agentes: {reporte['agentes']} (planificados {reporte['planificados']}, "
+             f"sin plan {reporte['sin_plan']})\n"
+             f"Planificación: {reporte['segundos'] * 1000:.1f} ms, "
+             f"{reporte['agentes_por_segundo']:.0f} agentes/s, {reporte['expansiones']} expansiones, "
+             f"{reporte['heuristicas']} heurísticas calculadas (una por meta distinta)\n"
+             f"Conflictos resueltos: {reporte['conflictos_resueltos']} "
+             f"(restantes: {reporte['conflictos_restantes']}; "
+             f"sin resolver por agentes sin plan: {reporte['conflictos_sin_plan']})\n"
+             f"Costo total: {reporte['costo_total']}, Duración: {reporte['ticks']} ticks")
+    if reporte["sin_plan"]:
+        texto += (f"\nAviso: {reporte['sin_plan']} agentes quedaron sin plan. En pasillos de una celda, "
+                  "un agente detenido en su meta bloquea el paso a los demás; prueba con menos "
+                  "agentes o con un laberinto abierto (--aleatorio 40x40).")
+    return texto
+
+def agentes_aleatorios(lab, cantidad, semilla=None):
+    """
+    Elige `cantidad` pares (inicio, meta) distintos dentro de la zona conectada más grande
+    del laberinto. Inicios y metas no se repiten entre agentes (cada agente se queda en su meta).
+    """
+    alto, ancho = len(lab), len(lab[0])
+    pendientes = {(i, j) for i in range(alto) for j in range(ancho) if costo_agente(lab[i][j]) is not None}
+    zona = []
+    while pendientes:  # Busca la zona conectada más grande
+        frontera = [pendientes.pop()]
+        actual = []
+        while frontera:
+            i, j = frontera.pop()
+            actual.append((i, j))
+            for di, dj in MOVIMIENTOS:
+                if (i + di, j + dj) in pendientes:
+                    pendientes.remove((i + di, j + dj))
+                    frontera.append((i + di, j + dj))
+        if len(actual) > len(zona):
+            zona = actual
+
+    generador = random.Random(semilla)
+    zona.sort()
+    cantidad = min(cantidad, len(zona))
+    return list(zip(generador.sample(zona, cantidad), generador.sample(zona, cantidad)))
+
+def laberinto_aleatorio(filas, columnas, densidad=0.2, semilla=None):
+    """Laberinto abierto con bordes de pared, paredes al azar y algo de terreno con costo 2-5."""
+    generador = random.Random(semilla)
+    lab = []
+    for i in range(filas):
+        fila = []
+        for j in range(columnas):
+            if i in (0, filas - 1) or j in (0, columnas - 1) or generador.random() < densidad:
+                fila.append("1")
+            elif generador.random() < 0.1:
+                fila.append(str(generador.randint(2, 5)))
+            else:
+                fila.append("0")
+        lab.append(fila)
+    lab[1][1], lab[filas - 2][columnas - 2] = "A", "B"
+    return lab
+
 class LaberintoApp:
-    def __init__(self, root, lab):
+    def __init__(self, root, lab, agentes=None):
+        """Con `agentes` ([(inicio, meta), ...]) planifica y anima a todos juntos en vez de la bolita A -> B."""
+        import tkinter as tk  # Para crear la ventana y los gráficos
+
         self.root = root  # Esto es la ventana principal del programa.
         self.laberinto = lab  # Aquí guardamos el laberinto (la matriz de números).
         self.inicio, self.fin = self.encontrar_puntos()  # Busca dónde está A (inicio) y B (meta).
@@ -36,27 +360,33 @@ class LaberintoApp:
         # Tamaño del laberinto (filas y columnas).
         self.alto = len(lab)  # Cuántas filas tiene.
         self.ancho = len(lab[0])  # Cuántas columnas tiene.
+        self.tam = min(TAM_CELDA, max(4, TAM_VENTANA // max(self.alto, self.ancho)))  # Lado de cada celda
         
         # Creamos un “lienzo” (como una hoja de dibujo) donde pondremos el laberinto.
         self.canvas = tk.Canvas(
             root, 
-            width=self.ancho * TAM_CELDA,  # Ancho total (columnas * tamaño de cada celda).
-            height=self.alto * TAM_CELDA    # Alto total (filas * tamaño de cada celda).
+            width=self.ancho * self.tam,  # Ancho total (columnas * tamaño de cada celda).
+            height=self.alto * self.tam    # Alto total (filas * tamaño de cada celda).
         )
         self.canvas.pack()  # Lo añadimos a la ventana.
         
         # Dibujamos el laberinto por primera vez.
         self.dibujar_laberinto()
+
+        # Modo de varios agentes: se planifican en lote y se animan con after()
+        if agentes is not None:
+            self.iniciar_agentes(agentes)
+            return
         
         # Coordenadas de la celda de inicio
         inicio_i, inicio_j = self.inicio
         
         # Creamos la bolita verde (nuestro “agente inteligente”).
         self.bolita = self.canvas.create_oval(
-            inicio_j * TAM_CELDA + 10,  # Posición X
-            inicio_i * TAM_CELDA + 10,  # Posición Y
-            inicio_j * TAM_CELDA + 30,
-            inicio_i * TAM_CELDA + 30,
+            inicio_j * self.tam + self.tam // 4,  # Posición X
+            inicio_i * self.tam + self.tam // 4,  # Posición Y
+            inicio_j * self.tam + self.tam * 3 // 4,
+            inicio_i * self.tam + self.tam * 3 // 4,
             fill="green"  # Color verde.
         )
         
@@ -74,9 +404,9 @@ class LaberintoApp:
         for i, fila in enumerate(self.laberinto):  # Recorre cada fila.
             for j, celda in enumerate(fila):  # Recorre cada celda en la fila.
                 # Coordenadas de la celda (esquina superior izquierda).
-                x1, y1 = j * TAM_CELDA, i * TAM_CELDA
+                x1, y1 = j * self.tam, i * self.tam
                 # Coordenadas de la esquina inferior derecha.
-                x2, y2 = x1 + TAM_CELDA, y1 + TAM_CELDA
+                x2, y2 = x1 + self.tam, y1 + self.tam
                 
                 # Elegimos el color según lo que haya en la celda.
                 if celda == "1":
@@ -85,6 +415,8 @@ class LaberintoApp:
                     color = "white"  # Inicio (fondo blanco). 
                 elif celda == "B":
                     color = "red"    # Meta (rojo).
+                elif celda in "23456789":
+                    color = COLORES_TERRENO[int(celda)]  # Terreno con costo.
                 else:
                     color = "white"  # Camino libre (blanco).
                 
@@ -98,62 +430,16 @@ class LaberintoApp:
 
     def encontrar_puntos(self):
         """Busca y retorna las coordenadas (fila, columna) de 'A' y 'B'."""
-        inicio, fin = None, None
-        for i, fila in enumerate(self.laberinto):
-            for j, celda in enumerate(fila):
-                if celda == "A":
-                    inicio = (i, j)
-                elif celda == "B":
-                    fin = (i, j)
-        return inicio, fin
+        return busqueda.find_points(self.laberinto)
 
     def heuristica(self, nodo):
         """Calcula la distancia de Manhattan (h) desde un nodo hasta la meta."""
         return abs(nodo[0] - self.fin[0]) + abs(nodo[1] - self.fin[1])
 
     def buscar_camino(self):
-        """Implementa el algoritmo A* para encontrar el camino más corto."""
-        
-        # open_list: (f_score, g_score, nodo)
-        open_list = [(0 + self.heuristica(self.inicio), 0, self.inicio)]
-        # g_score: costo real desde el inicio hasta el nodo
-        g_score = {self.inicio: 0}
-        # came_from: guarda el nodo anterior para reconstruir el camino
-        came_from = {} 
-
-        while open_list:
-            # Obtiene el nodo con el menor f_score (f = g + h)
-            _, g_current, current_node = heapq.heappop(open_list)
-
-            if current_node == self.fin:
-                # Reconstruir camino:
-                path = []
-                while current_node in came_from:
-                    path.append(current_node)
-                    current_node = came_from[current_node]
-                path.append(self.inicio)
-                return path[::-1] # Retorna la lista de nodos en orden de inicio a fin
-
-            i, j = current_node
-            
-            # Explora vecinos (arriba, abajo, izquierda, derecha)
-            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                ni, nj = i + dx, j + dy
-                neighbor = (ni, nj)
-                
-                # Comprueba límites y si la celda es transitable (0 o B)
-                if 0 <= ni < self.alto and 0 <= nj < self.ancho and self.laberinto[ni][nj] in ["0", "B"]:
-                    
-                    tentative_g_score = g_current + 1
-                    
-                    # Si encontramos una ruta mejor al vecino
-                    if tentative_g_score < g_score.get(neighbor, float('inf')):
-                        came_from[neighbor] = current_node # Guarda el paso anterior
-                        g_score[neighbor] = tentative_g_score # Actualiza el costo real
-                        f_score = tentative_g_score + self.heuristica(neighbor)
-                        heapq.heappush(open_list, (f_score, tentative_g_score, neighbor))
-        
-        return []  # No se encontró camino
+        """Busca el camino de menor costo de A a B con el A* de busqueda.py."""
+        with perfil.fase("busqueda"):
+            return busqueda.find_path(self.laberinto, self.inicio, self.fin)
 
     def explorar(self):
         """Mueve la bolita a través del camino óptimo, coloreando las celdas."""
@@ -165,36 +451,126 @@ class LaberintoApp:
             writer.writerow(["Fila", "Columna"])
             
             for i, j in self.camino:
-                # 1. Mover la bolita a las nuevas coordenadas
-                self.canvas.coords(
-                    self.bolita,
-                    j * TAM_CELDA + 10,
-                    i * TAM_CELDA + 10,
-                    j * TAM_CELDA + 30,
-                    i * TAM_CELDA + 30
-                )
-                
-                # 2. Colorear la celda como camino recorrido (amarillo)
-                x1, y1 = j * TAM_CELDA, i * TAM_CELDA
-                x2, y2 = x1 + TAM_CELDA, y1 + TAM_CELDA
-                
-                # Evita recolorear el inicio (A) y la meta (B)
-                if self.laberinto[i][j] not in ["A", "B"]:
-                    # Dibuja el rectángulo amarillo detrás de la bolita
-                    rect_id = self.canvas.create_rectangle(x1, y1, x2, y2, fill="yellow", outline="gray", tags="path")
-                    self.canvas.lower(rect_id) # CORRECCIÓN: Usar self.canvas.lower(ID)
+                with perfil.fase("dibujo"):
+                    # 1. Mover la bolita a las nuevas coordenadas
+                    self.canvas.coords(
+                        self.bolita,
+                        j * self.tam + self.tam // 4,
+                        i * self.tam + self.tam // 4,
+                        j * self.tam + self.tam * 3 // 4,
+                        i * self.tam + self.tam * 3 // 4
+                    )
+                    
+                    # 2. Colorear la celda como camino recorrido (amarillo)
+                    x1, y1 = j * self.tam, i * self.tam
+                    x2, y2 = x1 + self.tam, y1 + self.tam
+                    
+                    # Evita recolorear el inicio (A) y la meta (B)
+                    if self.laberinto[i][j] not in ["A", "B"]:
+                        # Dibuja el rectángulo amarillo detrás de la bolita
+                        rect_id = self.canvas.create_rectangle(x1, y1, x2, y2, fill="yellow", outline="gray", tags="path")
+                        self.canvas.lower(rect_id) # CORRECCIÓN: Usar self.canvas.lower(ID)
+                    self.canvas.update()
                 
                 # 3. Registrar y Pausar
-                writer.writerow([i, j])
-                self.canvas.update()
+                with perfil.fase("registro"):
+                    writer.writerow([i, j])
                 self.canvas.after(200) # Espera 200ms para que sea visible
             
         print("Llegó a la meta")
 
+    def iniciar_agentes(self, agentes):
+        """Planifica todos los agentes con A* cooperativo, muestra el reporte y empieza la animación."""
+        with perfil.fase("planificacion"):
+            self.planes, self.reporte = planificar_agentes(self.laberinto, agentes)
+        print(texto_reporte(self.reporte))
+        self.root.title(f"A* cooperativo - {self.reporte['planificados']}/{self.reporte['agentes']} agentes, "
+                        f"{self.reporte['conflictos_resueltos']} conflictos resueltos")
+
+        # Un color por agente; la meta se marca con un cuadrito del mismo color
+        self.agentes = []  # (plan, id del círculo)
+        margen = max(1, self.tam // 5)
+        for k, plan in enumerate(self.planes):
+            if not plan:
+                continue  # Sin plan: no se mueve ni se dibuja
+            color = "#%02x%02x%02x" % tuple(int(255 * c) for c in colorsys.hsv_to_rgb(k * 0.618034 % 1, 0.75, 0.9))
+            (mi, mj) = plan[-1]
+            self.canvas.create_rectangle(mj * self.tam + margen, mi * self.tam + margen,
+                                         (mj + 1) * self.tam - margen, (mi + 1) * self.tam - margen,
+                                         outline=color, width=2, tags="meta")
+            i, j = plan[0]
+            bolita = self.canvas.create_oval(j * self.tam + margen, i * self.tam + margen,
+                                             (j + 1) * self.tam - margen, (i + 1) * self.tam - margen,
+                                             fill=color, outline="")
+            self.agentes.append((plan, bolita))
+        self.tick = 0
+        self.canvas.after(RETARDO_AGENTES, self.animar_agentes)
+
+    def animar_agentes(self):
+        """Mueve a cada agente a su celda del tick siguiente; se reprograma hasta que todos llegan."""
+        self.tick += 1
+        margen = max(1, self.tam // 5)
+        with perfil.fase("dibujo"):
+            for plan, bolita in self.agentes:
+                if self.tick < len(plan):
+                    i, j = plan[self.tick]
+                    self.canvas.coords(bolita, j * self.tam + margen, i * self.tam + margen,
+                                       (j + 1) * self.tam - margen, (i + 1) * self.tam - margen)
+        perfil.cuadro()
+        if self.tick < self.reporte["ticks"]:
+            self.canvas.after(RETARDO_AGENTES, self.animar_agentes)
+        else:
+            print("Los agentes planificados llegaron a su meta")
+
 # --- Bloque de Inicialización y Ejecución ---
 
-# Ejecutar interfaz
-root = tk.Tk()
-root.title("Laberinto con A* - Camino Óptimo")
-app = LaberintoApp(root, laberinto)
-root.mainloop()
\ No newline at end of file
+def main(argv=None):
+    """Abre la ventana y anima el camino encontrado (o el plan conjunto de varios agentes)."""
+    global perfil
+
+    perfil = perfilado.crear("laberinto_astar")  # Quita --perfil de sys.argv antes de leer las opciones
+
+    parser = argparse.ArgumentParser(description="Laberinto con A*; con --agentes, A* cooperativo de varios agentes.")
+    parser.add_argument("archivo", nargs="?", help="laberinto de texto (por defecto el de la práctica)")
+    parser.add_argument("--agentes", type=int, default=0, help="número de agentes con inicio y meta al azar")
+    parser.add_argument("--aleatorio", metavar="FILASxCOLUMNAS", help="usar un laberinto abierto al azar, por ejemplo 60x60")
+    parser.add_argument("--semilla", type=int, default=0, help="semilla del laberinto y de los agentes")
+    parser.add_argument("--sin-ventana", action="store_true", help="solo planificar e imprimir el reporte")
+    args = parser.parse_args(argv)
+
+    lab = laberinto
+    if args.aleatorio:
+        try:
+            filas, columnas = (int(n) for n in args.aleatorio.lower().split("x"))
+        except ValueError:
+            parser.error("--aleatorio debe tener la forma FILASxCOLUMNAS, por ejemplo 60x60")
+        if filas < 3 or columnas < 3:
+            parser.error("--aleatorio necesita al menos 3x3")
+        lab = laberinto_aleatorio(filas, columnas, semilla=args.semilla)
+    elif args.archivo:
+        try:
+            lab = busqueda.load_rows(args.archivo)
+        except (OSError, ValueError) as e:
+            parser.error(f"{args.archivo}: {e}")
+
+    agentes = agentes_aleatorios(lab, args.agentes, args.semilla) if args.agentes > 0 else None
+    if agentes is None and None in busqueda.find_points(lab):
+        parser.error("el laberinto necesita un inicio 'A' y un fin 'B' (o usa --agentes)")
+
+    if args.sin_ventana:
+        if agentes is None:
+            parser.error("--sin-ventana requiere --agentes")
+        with perfil.fase("planificacion"):
+            _, reporte = planificar_agentes(lab, agentes)
+        print(texto_reporte(reporte))
+        return
+
+    # Ejecutar interfaz
+    import tkinter as tk
+    root = tk.Tk()
+    root.title("Laberinto con A* - Camino Óptimo")
+    app = LaberintoApp(root, lab, agentes)
+    root.mainloop()
+
+if __name__ == "__main__":
+    main()
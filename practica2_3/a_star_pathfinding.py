@@ -1,68 +1,98 @@
-import tkinter as tk
-from queue import PriorityQueue, Queue
-from datetime import datetime # Agregado para usar datetime si fuera necesario (aunque no se usa en este código final)
+import multiprocessing  # Para ejecutar todos los algoritmos a la vez sin congelar la ventana
+import os
+import sys
+import busqueda  # Modelo de la cuadrícula y algoritmos (sin interfaz gráfica)
+from busqueda import ROWS, COLS
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))  # perfilado.py está en la raíz del repositorio
+import perfilado  # Perfilado opcional (PERFILADO=1 o --perfil)
+
+perfil = perfilado.INACTIVO  # main() crea el perfilador real
 
 # --- 1. Configuración Global ---
-ROWS = 20
-COLS = 20
 CELL_SIZE = 30 # Tamaño de cada celda en píxeles
 
-# --- 2. Clase de la Celda (Nodo) ---
-class Cell:
-    """Representa un nodo en la cuadrícula."""
-    def __init__(self, row, col):
-        self.row = row
-        self.col = col
-        self.is_start = False
-        self.is_end = False
-        self.is_wall = False
-        self.color = "white"
-
-    def draw(self, canvas):
-        """Dibuja la celda en el canvas de Tkinter."""
-        x1 = self.col * CELL_SIZE
-        y1 = self.row * CELL_SIZE
-        x2 = x1 + CELL_SIZE
-        y2 = y1 + CELL_SIZE
-        canvas.create_rectangle(x1, y1, x2, y2, fill=self.color, outline="gray")
-
-    def __lt__(self, other):
-        """Método de comparación para la PriorityQueue. Siempre False para evitar errores, ya que la prioridad se maneja con la tupla (score, cell)."""
-        return False
-
-# --- 3. Funciones de Utilidad de la Cuadrícula ---
-def create_grid():
-    """Crea la cuadrícula (matriz 2D) de objetos Cell."""
-    return [[Cell(r, c) for c in range(COLS)] for r in range(ROWS)]
+# Costos de terreno que se pueden pintar y su color (más oscuro = más caro)
+TERRAIN_COLORS = {1: "white", 3: "#f3e2b3", 5: "#d9b26f", 9: "#a0764a"}
+
+# Color del camino de cada algoritmo
+PATH_COLORS = {"A*": "lightseagreen", "Dijkstra": "purple", "Dial": "orange", "BFS": "skyblue"}
+POLL_MS = 50 # Cada cuánto se revisan los resultados de "Ejecutar todos"
+
+# Estado de la interfaz (se inicializa en main(), así importar este módulo no abre ninguna ventana)
+root = None
+canvas = None
+grid = None
+start_cell = None
+end_cell = None
+stats_astar = stats_dijkstra = stats_dial = stats_bfs = None
+tool = None # Herramienta seleccionada: 0 = inicio/fin/pared, N > 0 = pintar terreno de costo N
+progress = progress_label = None
+
+# Estado de "Ejecutar todos": procesos trabajadores y resultados pendientes por algoritmo
+pool = None
+pending = {}
+poll_job = None
+
+# --- 2. Dibujo de la Cuadrícula ---
+def draw_cell(canvas, cell):
+    """Dibuja la celda en el canvas de Tkinter."""
+    x1 = cell.col * CELL_SIZE
+    y1 = cell.row * CELL_SIZE
+    x2 = x1 + CELL_SIZE
+    y2 = y1 + CELL_SIZE
+    canvas.create_rectangle(x1, y1, x2, y2, fill=cell.color, outline="gray")
 
 def draw_grid(canvas, grid):
     """Dibuja todo el grid en el canvas, limpiando el anterior."""
-    canvas.delete("all")
-    for row in grid:
-        for cell in row:
-            cell.draw(canvas)
+    with perfil.fase("dibujo"):
+        canvas.delete("all")
+        for row in grid:
+            for cell in row:
+                draw_cell(canvas, cell)
 
 def get_cell(event):
     """Obtiene la celda en la que se hizo clic."""
     row = event.y // CELL_SIZE
     col = event.x // CELL_SIZE
-    if 0 <= row < ROWS and 0 <= col < COLS:
+    if 0 <= row < len(grid) and 0 <= col < len(grid[0]):
         return grid[row][col]
     return None
 
+def terrain_color(cell):
+    """Color de una celda libre según el costo de su terreno."""
+    return TERRAIN_COLORS.get(cell.cost, "white")
+
 def clear_paths():
-    """Limpia los colores de los caminos encontrados, dejando solo inicio, fin y paredes."""
+    """Limpia los colores de los caminos encontrados, dejando solo inicio, fin, paredes y terreno."""
     for row in grid:
         for cell in row:
             if not (cell.is_start or cell.is_end or cell.is_wall):
-                cell.color = "white"
-                
-# --- 4. Funciones de Interacción y Lógica Común ---
+                cell.color = terrain_color(cell)
+
+# --- 3. Funciones de Interacción ---
+def paint_terrain(event):
+    """Pinta el costo de la herramienta seleccionada en la celda bajo el ratón."""
+    cell = get_cell(event)
+    if cell and not (cell.is_start or cell.is_end or cell.is_wall) and cell.cost != tool.get():
+        cancel_run_all() # Los resultados en curso ya no corresponderían a la cuadrícula
+        cell.cost = tool.get()
+        clear_paths()
+        draw_grid(canvas, grid)
+
+def on_drag(event):
+    """Al arrastrar con una herramienta de terreno, pinta todas las celdas por las que pasa."""
+    if tool.get():
+        paint_terrain(event)
+
 def on_click(event):
-    """Maneja el clic del ratón para establecer inicio, fin o paredes."""
+    """Maneja el clic del ratón para establecer inicio, fin o paredes (o pintar terreno)."""
     global start_cell, end_cell
+    if tool.get():
+        paint_terrain(event)
+        return
     cell = get_cell(event)
     if cell:
+        cancel_run_all() # Los resultados en curso ya no corresponderían a la cuadrícula
         # Establecer Inicio (Verde)
         if not start_cell and not cell.is_wall:
             cell.is_start = True
@@ -76,210 +106,256 @@ def on_click(event):
         # Establecer/Quitar Pared (Negro/Blanco)
         elif cell != start_cell and cell != end_cell:
             cell.is_wall = not cell.is_wall
-            cell.color = "black" if cell.is_wall else "white"
-            
+            cell.color = "black" if cell.is_wall else terrain_color(cell)
+
         clear_paths() # Limpiar caminos al cambiar obstáculos
         draw_grid(canvas, grid)
 
-def h(a, b):
-    """Función heurística de Distancia Manhattan (para A*)."""
-    return abs(a.row - b.row) + abs(a.col - b.col)
-
-def get_neighbors(cell):
-    """Retorna los vecinos válidos (no paredes) de una celda."""
-    neighbors = []
-    # Movimiento en las 4 direcciones (arriba, abajo, izquierda, derecha)
-    for dr, dc in [(-1,0), (1,0), (0,-1), (0,1)]:
-        r, c = cell.row + dr, cell.col + dc
-        if 0 <= r < ROWS and 0 <= c < COLS:
-            neighbor = grid[r][c]
-            if not neighbor.is_wall:
-                neighbors.append(neighbor)
-    return neighbors
-
-def reconstruct_path(came_from, current, color):
-    """Traza el camino desde el final hasta el inicio y cuenta los pasos."""
-    steps = 0
-    while current in came_from:
-        current = came_from[current]
-        if not current.is_start:
-            current.color = color
-        steps += 1
-    return steps
-
-# --- 5. Algoritmos de Búsqueda ---
-
+def show_result(name, result, color, label, elapsed=None):
+    """Colorea el camino encontrado y muestra las estadísticas en su etiqueta."""
+    for cell in result.path[1:-1]: # Sin colorear el inicio ni el fin
+        cell.color = color
+    draw_grid(canvas, grid)
+    if result.path:
+        text = (f"{name}: Nodos Explorados: {result.explored}, Pasos del Camino: {result.steps}, "
+                f"Costo: {result.cost}")
+    else:
+        text = f"{name}: Nodos Explorados: {result.explored}, sin camino"
+    if elapsed is not None:
+        text += f", Tiempo: {elapsed * 1000:.1f} ms"
+    label.config(text=text)
+
+# --- 4. Algoritmos de Búsqueda (botones) ---
 def run_a_star():
     """Ejecuta el algoritmo de búsqueda A*."""
     if not start_cell or not end_cell:
         return # No ejecutar si no hay inicio/fin
-        
+    cancel_run_all() # Un "Ejecutar todos" en curso pintaría encima de este resultado
     clear_paths()
-    open_set = PriorityQueue()
-    open_set.put((0, start_cell))
-    came_from = {}
-    
-    # Inicialización de scores y el conjunto abierto
-    g_score = {cell: float("inf") for row in grid for cell in row}
-    g_score[start_cell] = 0
-    f_score = {cell: float("inf") for row in grid for cell in row}
-    f_score[start_cell] = h(start_cell, end_cell)
-    open_set_hash = {start_cell} # Conjunto para verificar rápidamente si un nodo está en la cola de prioridad
-    
-    explored = 0
-    while not open_set.empty():
-        current = open_set.get()[1]
-        open_set_hash.remove(current)
-        explored += 1
-
-        if current == end_cell:
-            steps = reconstruct_path(came_from, end_cell, "lightseagreen")
-            draw_grid(canvas, grid)
-            stats_astar.config(text=f"A*: Nodos Explorados: {explored}, Pasos del Camino: {steps}")
-            return
-
-        for neighbor in get_neighbors(current):
-            # El coste de moverse a un vecino es 1 (g_score[current] + 1)
-            temp_g_score = g_score[current] + 1 
-            
-            if temp_g_score < g_score[neighbor]:
-                # Se encontró un camino mejor
-                came_from[neighbor] = current
-                g_score[neighbor] = temp_g_score
-                # f_score = g_score + h (costo real + costo estimado)
-                f_score[neighbor] = temp_g_score + h(neighbor, end_cell) 
-                
-                if neighbor not in open_set_hash:
-                    open_set.put((f_score[neighbor], neighbor))
-                    open_set_hash.add(neighbor)
+    with perfil.fase("A*"):
+        result = busqueda.run_a_star(grid, start_cell, end_cell)
+    show_result("A*", result, PATH_COLORS["A*"], stats_astar)
 
 def run_dijkstra():
     """Ejecuta el algoritmo de Dijkstra."""
     if not start_cell or not end_cell:
         return
-        
+    cancel_run_all()
     clear_paths()
-    queue = PriorityQueue()
-    queue.put((0, start_cell)) # Prioridad es la distancia
-    came_from = {}
-    distance = {cell: float("inf") for row in grid for cell in row}
-    distance[start_cell] = 0
-    visited = set()
-    explored = 0
-    
-    while not queue.empty():
-        dist, current = queue.get()
-        
-        if current in visited:
-            continue
-        
-        visited.add(current)
-        explored += 1
-
-        if current == end_cell:
-            steps = reconstruct_path(came_from, end_cell, "purple")
-            draw_grid(canvas, grid)
-            stats_dijkstra.config(text=f"Dijkstra: Nodos Explorados: {explored}, Pasos del Camino: {steps}")
-            return
-
-        for neighbor in get_neighbors(current):
-            new_dist = distance[current] + 1 # Costo a vecino es 1
-            
-            if new_dist < distance[neighbor]:
-                # Se encontró un camino más corto
-                distance[neighbor] = new_dist
-                came_from[neighbor] = current
-                queue.put((new_dist, neighbor)) # Agregar/actualizar en la cola
+    with perfil.fase("Dijkstra"):
+        result = busqueda.run_dijkstra(grid, start_cell, end_cell)
+    show_result("Dijkstra", result, PATH_COLORS["Dijkstra"], stats_dijkstra)
+
+def run_dial():
+    """Ejecuta el algoritmo de Dial (Dijkstra con cola de cubetas)."""
+    if not start_cell or not end_cell:
+        return
+    cancel_run_all()
+    clear_paths()
+    with perfil.fase("Dial"):
+        result = busqueda.run_dial(grid, start_cell, end_cell)
+    show_result("Dial", result, PATH_COLORS["Dial"], stats_dial)
 
 def run_bfs():
     """Ejecuta el algoritmo de Búsqueda en Amplitud (BFS)."""
     if not start_cell or not end_cell:
         return
-        
+    cancel_run_all()
     clear_paths()
-    queue = Queue() # Usamos la Queue estándar (FIFO)
-    queue.put(start_cell)
-    came_from = {}
-    visited = set([start_cell])
-    explored = 0
-    
-    while not queue.empty():
-        current = queue.get()
-        explored += 1
-        
-        if current == end_cell:
-            steps = reconstruct_path(came_from, end_cell, "skyblue")
-            draw_grid(canvas, grid)
-            stats_bfs.config(text=f"BFS: Nodos Explorados: {explored}, Pasos del Camino: {steps}")
-            return
-
-        for neighbor in get_neighbors(current):
-            if neighbor not in visited:
-                visited.add(neighbor)
-                came_from[neighbor] = current
-                queue.put(neighbor)
+    with perfil.fase("BFS"):
+        result = busqueda.run_bfs(grid, start_cell, end_cell)
+    show_result("BFS", result, PATH_COLORS["BFS"], stats_bfs)
+
+# --- 5. Ejecutar Todos en Paralelo ---
+def stats_label(name):
+    """Etiqueta de estadísticas de cada algoritmo."""
+    return {"A*": stats_astar, "Dijkstra": stats_dijkstra, "Dial": stats_dial, "BFS": stats_bfs}[name]
+
+def run_all():
+    """
+    Copia la cuadrícula y ejecuta todos los algoritmos a la vez en procesos trabajadores.
+    Los resultados se recogen con root.after (poll_run_all), así la ventana sigue respondiendo.
+    """
+    global pool, pending
+    if not start_cell or not end_cell or pending:
+        return # Sin inicio/fin, o ya hay una ejecución en curso
+
+    clear_paths()
+    draw_grid(canvas, grid)
+    snapshot = busqueda.snapshot_grid(grid, start_cell, end_cell)
+
+    if pool is None:
+        pool = multiprocessing.Pool(processes=len(busqueda.ALGORITHMS))
+    for name in busqueda.ALGORITHMS:
+        stats_label(name).config(text=f"{name}: ejecutando...")
+        pending[name] = pool.apply_async(busqueda.solve_snapshot, (snapshot, name))
+
+    progress.config(maximum=len(pending), value=0)
+    progress_label.config(text=f"Ejecutando 0/{len(pending)}")
+    schedule_poll()
+
+def schedule_poll():
+    """Programa la siguiente revisión de resultados."""
+    global poll_job
+    poll_job = root.after(POLL_MS, poll_run_all)
+
+def poll_run_all():
+    """Muestra los resultados que ya terminaron y vuelve a programarse si falta alguno."""
+    global poll_job
+    poll_job = None
+    for name, async_result in list(pending.items()):
+        if not async_result.ready():
+            continue
+        del pending[name]
+        try:
+            result, elapsed = async_result.get()
+        except Exception as e:
+            stats_label(name).config(text=f"{name}: error: {e}")
+            continue
+        # El camino llega como coordenadas: se traduce a las celdas de esta cuadrícula
+        result = result._replace(path=[grid[r][c] for r, c in result.path])
+        show_result(name, result, PATH_COLORS[name], stats_label(name), elapsed)
+
+    total = len(busqueda.ALGORITHMS)
+    progress.config(value=total - len(pending))
+    if pending:
+        progress_label.config(text=f"Ejecutando {total - len(pending)}/{total}")
+        schedule_poll()
+    else:
+        progress_label.config(text="Listo")
+
+def cancel_run_all():
+    """Cancela "Ejecutar todos": detiene los procesos trabajadores y descarta lo pendiente."""
+    global pool, poll_job
+    if not pending:
+        return
+    if poll_job is not None:
+        root.after_cancel(poll_job)
+        poll_job = None
+    pool.terminate() # Única forma de detener una búsqueda que ya empezó
+    pool = None
+    for name in pending:
+        stats_label(name).config(text=f"{name}: cancelado")
+    pending.clear()
+    progress.config(value=0)
+    progress_label.config(text="Cancelado")
+
+def on_close():
+    """Cierra la ventana terminando los procesos trabajadores."""
+    cancel_run_all()
+    if pool is not None:
+        pool.terminate()
+    root.destroy()
 
 # --- 6. Funciones de Control de la Interfaz ---
 def reset_grid():
     """Reinicia la cuadrícula y las estadísticas."""
     global start_cell, end_cell
+    cancel_run_all()
     start_cell = None
     end_cell = None
-    
+
     for row in grid:
         for cell in row:
             cell.is_start = False
             cell.is_end = False
             cell.is_wall = False
+            cell.cost = 1
             cell.color = "white"
-            
+
     draw_grid(canvas, grid)
     stats_astar.config(text="A*: ")
     stats_dijkstra.config(text="Dijkstra: ")
+    stats_dial.config(text="Dial: ")
     stats_bfs.config(text="BFS: ")
 
 # --- 7. Interfaz Tkinter ---
-root = tk.Tk()
-root.title("Comparación de Algoritmos de Búsqueda de Caminos")
+def main():
+    """Crea la ventana e inicia la aplicación (tkinter solo se importa aquí)."""
+    global root, canvas, grid, start_cell, end_cell, stats_astar, stats_dijkstra, stats_dial, stats_bfs, tool
+    global progress, progress_label, perfil
+    import tkinter as tk
+    from tkinter import ttk
+
+    perfil = perfilado.crear("a_star_pathfinding")
+
+    root = tk.Tk()
+    root.title("Comparación de Algoritmos de Búsqueda de Caminos")
+
+    # Crear el Canvas y la Cuadrícula
+    canvas = tk.Canvas(root, width=COLS*CELL_SIZE, height=ROWS*CELL_SIZE)
+    canvas.pack()
+    grid = busqueda.create_grid()
+    start_cell = None
+    end_cell = None
 
-# Crear el Canvas y la Cuadrícula
-canvas = tk.Canvas(root, width=COLS*CELL_SIZE, height=ROWS*CELL_SIZE)
-canvas.pack()
-grid = create_grid()
-start_cell = None
-end_cell = None
+    # Configurar eventos y dibujo inicial
+    canvas.bind("<Button-1>", on_click) # Clic izquierdo para configurar
+    canvas.bind("<B1-Motion>", on_drag) # Arrastrar para pintar terreno
+    draw_grid(canvas, grid)
+
+    # Herramientas: inicio/fin/pared o pintar terreno con un costo
+    tool = tk.IntVar(value=0)
+    tool_frame = tk.Frame(root)
+    tool_frame.pack(pady=5)
+    tk.Radiobutton(tool_frame, text="Inicio/Fin/Pared", variable=tool, value=0).pack(side="left")
+    for cost, color in TERRAIN_COLORS.items():
+        tk.Radiobutton(tool_frame, text=f"Costo {cost}", variable=tool, value=cost,
+                       bg=color, indicatoron=False, width=8).pack(side="left", padx=2)
+
+    # Marco para los botones
+    btn_frame = tk.Frame(root)
+    btn_frame.pack(pady=5)
+
+    # Botones de Algoritmos
+    btn_astar = tk.Button(btn_frame, text="Ejecutar A*", command=run_a_star)
+    btn_astar.pack(side="left", padx=5)
+
+    btn_dijkstra = tk.Button(btn_frame, text="Ejecutar Dijkstra", command=run_dijkstra)
+    btn_dijkstra.pack(side="left", padx=5)
+
+    btn_dial = tk.Button(btn_frame, text="Ejecutar Dial", command=run_dial)
+    btn_dial.pack(side="left", padx=5)
+
+    btn_bfs = tk.Button(btn_frame, text="Ejecutar BFS", command=run_bfs)
+    btn_bfs.pack(side="left", padx=5)
+
+    # Botón de Reinicio
+    reset_button = tk.Button(btn_frame, text="Reiniciar", command=reset_grid)
+    reset_button.pack(side="left", padx=5)
+
+    # Ejecutar todos los algoritmos en paralelo, con progreso y cancelación
+    run_frame = tk.Frame(root)
+    run_frame.pack(pady=5)
 
-# Configurar eventos y dibujo inicial
-canvas.bind("<Button-1>", on_click) # Clic izquierdo para configurar
-draw_grid(canvas, grid)
+    btn_all = tk.Button(run_frame, text="Ejecutar todos", command=run_all)
+    btn_all.pack(side="left", padx=5)
 
-# Marco para los botones
-btn_frame = tk.Frame(root)
-btn_frame.pack(pady=5)
+    btn_cancel = tk.Button(run_frame, text="Cancelar", command=cancel_run_all)
+    btn_cancel.pack(side="left", padx=5)
 
-# Botones de Algoritmos
-btn_astar = tk.Button(btn_frame, text="Ejecutar A*", command=run_a_star)
-btn_astar.pack(side="left", padx=5)
+    progress = ttk.Progressbar(run_frame, length=150, mode="determinate")
+    progress.pack(side="left", padx=5)
 
-btn_dijkstra = tk.Button(btn_frame, text="Ejecutar Dijkstra", command=run_dijkstra)
-btn_dijkstra.pack(side="left", padx=5)
+    progress_label = tk.Label(run_frame, text="")
+    progress_label.pack(side="left", padx=5)
 
-btn_bfs = tk.Button(btn_frame, text="Ejecutar BFS", command=run_bfs)
-btn_bfs.pack(side="left", padx=5)
+    # Etiquetas de Estadísticas
+    stats_astar = tk.Label(root, text="A*: ")
+    stats_astar.pack()
 
-# Botón de Reinicio
-reset_button = tk.Button(btn_frame, text="Reiniciar", command=reset_grid)
-reset_button.pack(side="left", padx=5)
+    stats_dijkstra = tk.Label(root, text="Dijkstra: ")
+    stats_dijkstra.pack()
 
-# Etiquetas de Estadísticas
-stats_astar = tk.Label(root, text="A*: ")
-stats_astar.pack()
+    stats_dial = tk.Label(root, text="Dial: ")
+    stats_dial.pack()
 
-stats_dijkstra = tk.Label(root, text="Dijkstra: ")
-stats_dijkstra.pack()
+    stats_bfs = tk.Label(root, text="BFS: ")
+    stats_bfs.pack()
 
-stats_bfs = tk.Label(root, text="BFS: ")
-stats_bfs.pack()
+    # Iniciar el bucle principal de la aplicación
+    root.protocol("WM_DELETE_WINDOW", on_close)
+    root.mainloop()
 
-# Iniciar el bucle principal de la aplicación
-root.mainloop()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
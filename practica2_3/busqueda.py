@@ -0,0 +1,411 @@
+"""
+Modelo de la cuadrícula y algoritmos de búsqueda de caminos (A*, Dijkstra, Dial, BFS).
+
+Este módulo no tiene efectos secundarios al importarse y no depende de tkinter,
+así que se puede usar desde pruebas, scripts (laberinto_astar.py resuelve aquí su
+camino de A a B) o la línea de comandos:
+
+    python busqueda.py laberintos/*.txt --algoritmos A* BFS --repeticiones 5
+    python busqueda.py --aleatorio 300x300 --repeticiones 3
+"""
+import argparse
+import heapq
+import random
+import sys
+import time
+from collections import deque, namedtuple
+
+# --- 1. Configuración por defecto de la cuadrícula ---
+ROWS = 20
+COLS = 20
+
+# Resultado de una búsqueda: nodos explorados, pasos del camino, lista de celdas (inicio -> fin)
+# y costo total del camino (suma de los costos de las celdas a las que se entra).
+# Si no hay camino, `path` es una lista vacía y `steps` y `cost` son 0.
+SearchResult = namedtuple("SearchResult", ["explored", "steps", "path", "cost"], defaults=(0,))
+
+# --- 2. Clase de la Celda (Nodo) ---
+class Cell:
+    """Representa un nodo en la cuadrícula."""
+    def __init__(self, row, col):
+        self.row = row
+        self.col = col
+        self.is_start = False
+        self.is_end = False
+        self.is_wall = False
+        self.cost = 1 # Costo de entrar a la celda (terreno); entero >= 1
+        self.color = "white"
+
+    def __lt__(self, other):
+        """Método de comparación para la cola de prioridad. Siempre False para evitar errores, ya que la prioridad se maneja con la tupla (score, cell)."""
+        return False
+
+# --- 3. Funciones de Utilidad de la Cuadrícula ---
+def create_grid(rows=ROWS, cols=COLS):
+    """Crea la cuadrícula (matriz 2D) de objetos Cell."""
+    return [[Cell(r, c) for c in range(cols)] for r in range(rows)]
+
+def h(a, b):
+    """Función heurística de Distancia Manhattan (para A*)."""
+    return abs(a.row - b.row) + abs(a.col - b.col)
+
+def get_neighbors(grid, cell):
+    """Retorna los vecinos válidos (no paredes) de una celda."""
+    rows, cols = len(grid), len(grid[0])
+    neighbors = []
+    # Movimiento en las 4 direcciones (arriba, abajo, izquierda, derecha)
+    for dr, dc in [(-1,0), (1,0), (0,-1), (0,1)]:
+        r, c = cell.row + dr, cell.col + dc
+        if 0 <= r < rows and 0 <= c < cols:
+            neighbor = grid[r][c]
+            if not neighbor.is_wall:
+                neighbors.append(neighbor)
+    return neighbors
+
+def reconstruct_path(came_from, current):
+    """Traza el camino desde el final hasta el inicio y lo retorna en orden (inicio -> fin)."""
+    path = [current]
+    while current in came_from:
+        current = came_from[current]
+        path.append(current)
+    return path[::-1]
+
+def _result(came_from, end, explored):
+    """Construye el SearchResult a partir del mapa de predecesores."""
+    path = reconstruct_path(came_from, end)
+    return SearchResult(explored, len(path) - 1, path, sum(cell.cost for cell in path[1:]))
+
+# --- 4. Algoritmos de Búsqueda ---
+
+def run_a_star(grid, start, end):
+    """Ejecuta el algoritmo de búsqueda A*."""
+    open_set = [(h(start, end), start)]
+    came_from = {}
+
+    # Inicialización de scores
+    g_score = {cell: float("inf") for row in grid for cell in row}
+    g_score[start] = 0
+    f_score = {cell: float("inf") for row in grid for cell in row}
+    f_score[start] = h(start, end)
+
+    explored = 0
+    while open_set:
+        f, current = heapq.heappop(open_set)
+        if f > f_score[current]:
+            continue # Entrada vieja: el nodo se volvió a encolar con un score mejor
+        explored += 1
+
+        if current == end:
+            return _result(came_from, end, explored)
+
+        for neighbor in get_neighbors(grid, current):
+            # El coste de moverse a un vecino es el costo de su terreno (1 por defecto)
+            temp_g_score = g_score[current] + neighbor.cost
+
+            if temp_g_score < g_score[neighbor]:
+                # Se encontró un camino mejor
+                came_from[neighbor] = current
+                g_score[neighbor] = temp_g_score
+                # f_score = g_score + h (costo real + costo estimado); h es admisible porque cost >= 1
+                f_score[neighbor] = temp_g_score + h(neighbor, end)
+                heapq.heappush(open_set, (f_score[neighbor], neighbor))
+
+    return SearchResult(explored, 0, [])
+
+def run_dijkstra(grid, start, end):
+    """Ejecuta el algoritmo de Dijkstra."""
+    queue = [(0, start)] # Prioridad es la distancia
+    came_from = {}
+    distance = {cell: float("inf") for row in grid for cell in row}
+    distance[start] = 0
+    visited = set()
+    explored = 0
+
+    while queue:
+        dist, current = heapq.heappop(queue)
+
+        if current in visited:
+            continue
+
+        visited.add(current)
+        explored += 1
+
+        if current == end:
+            return _result(came_from, end, explored)
+
+        for neighbor in get_neighbors(grid, current):
+            new_dist = distance[current] + neighbor.cost # Costo a vecino es el de su terreno
+
+            if new_dist < distance[neighbor]:
+                # Se encontró un camino más corto
+                distance[neighbor] = new_dist
+                came_from[neighbor] = current
+                heapq.heappush(queue, (new_dist, neighbor)) # Agregar/actualizar en la cola
+
+    return SearchResult(explored, 0, [])
+
+def run_dial(grid, start, end):
+    """
+    Ejecuta el algoritmo de Dial: Dijkstra con una cola de cubetas (bucket queue).
+    Como los costos son enteros pequeños (1..C), basta con C + 1 cubetas usadas de forma
+    circular, y insertar o sacar un nodo cuesta O(1) amortizado en lugar de O(log n).
+    """
+    max_cost = max(cell.cost for row in grid for cell in row if not cell.is_wall)
+    buckets = [[] for _ in range(max_cost + 1)]
+    buckets[0].append(start)
+    pending = 1 # Entradas en las cubetas (incluye entradas viejas)
+    came_from = {}
+    distance = {start: 0}
+    visited = set()
+    explored = 0
+
+    dist = 0
+    while pending:
+        bucket = buckets[dist % len(buckets)]
+        while bucket:
+            current = bucket.pop()
+            pending -= 1
+            if current in visited or distance[current] != dist:
+                continue # Entrada vieja: el nodo ya salió con una distancia menor
+
+            visited.add(current)
+            explored += 1
+
+            if current == end:
+                return _result(came_from, end, explored)
+
+            for neighbor in get_neighbors(grid, current):
+                new_dist = dist + neighbor.cost
+                if new_dist < distance.get(neighbor, float("inf")):
+                    distance[neighbor] = new_dist
+                    came_from[neighbor] = current
+                    buckets[new_dist % len(buckets)].append(neighbor)
+                    pending += 1
+        dist += 1
+
+    return SearchResult(explored, 0, [])
+
+def run_bfs(grid, start, end):
+    """Ejecuta el algoritmo de Búsqueda en Amplitud (BFS). Ignora los costos: minimiza pasos."""
+    queue = deque([start]) # Cola estándar (FIFO)
+    came_from = {}
+    visited = set([start])
+    explored = 0
+
+    while queue:
+        current = queue.popleft()
+        explored += 1
+
+        if current == end:
+            return _result(came_from, end, explored)
+
+        for neighbor in get_neighbors(grid, current):
+            if neighbor not in visited:
+                visited.add(neighbor)
+                came_from[neighbor] = current
+                queue.append(neighbor)
+
+    return SearchResult(explored, 0, [])
+
+# Algoritmos disponibles, en el orden en que se muestran
+ALGORITHMS = {
+    "A*": run_a_star,
+    "Dijkstra": run_dijkstra,
+    "Dial": run_dial,
+    "BFS": run_bfs,
+}
+
+# --- 5. Archivos de Laberinto ---
+def parse_rows(text):
+    """
+    Convierte el texto de un laberinto en filas de símbolos (listas de caracteres).
+    Formato (el mismo que laberinto_astar.py): una fila por línea, '1' o '#' = pared,
+    '0' o '.' = camino, '2'..'9' = terreno con ese costo, 'A' = inicio, 'B' = fin.
+    Se ignoran espacios y comas; '#' y '.' se devuelven como '1' y '0'.
+    """
+    rows = []
+    for line in text.splitlines():
+        symbols = [{"#": "1", ".": "0"}.get(s, s) for s in line.strip() if s not in " ,\t"]
+        if symbols:
+            rows.append(symbols)
+    if not rows:
+        raise ValueError("El laberinto está vacío.")
+    if any(len(row) != len(rows[0]) for row in rows):
+        raise ValueError("Todas las filas del laberinto deben tener el mismo largo.")
+    for r, row in enumerate(rows):
+        for symbol in row:
+            if symbol not in "0123456789AB":
+                raise ValueError(f"Símbolo desconocido {symbol!r} en la fila {r + 1}.")
+    return rows
+
+def load_rows(path):
+    """Lee un archivo de laberinto y retorna sus filas de símbolos (ver parse_rows)."""
+    with open(path, "r", encoding="utf-8") as f:
+        return parse_rows(f.read())
+
+def parse_maze(text):
+    """Convierte el texto de un laberinto (formato de parse_rows) en (grid, start, end)."""
+    grid, start, end = grid_from_rows(parse_rows(text))
+    if start is None or end is None:
+        raise ValueError("El laberinto debe tener un inicio 'A' y un fin 'B'.")
+    return grid, start, end
+
+def grid_from_rows(rows):
+    """
+    Construye (grid, start, end) a partir de filas de símbolos del mismo largo, como la
+    matriz `laberinto` de laberinto_astar.py. `start` o `end` son None si falta 'A' o 'B'.
+    """
+    grid = create_grid(len(rows), len(rows[0]))
+    start = end = None
+    for r, row in enumerate(rows):
+        for c, symbol in enumerate(row):
+            cell = grid[r][c]
+            if symbol in "1#":
+                cell.is_wall = True
+                cell.color = "black"
+            elif symbol == "A":
+                cell.is_start = True
+                cell.color = "green"
+                start = cell
+            elif symbol == "B":
+                cell.is_end = True
+                cell.color = "red"
+                end = cell
+            elif symbol in "23456789":
+                cell.cost = int(symbol)
+            elif symbol not in "0.":
+                raise ValueError(f"Símbolo desconocido {symbol!r} en la fila {r + 1}.")
+    return grid, start, end
+
+def load_maze(path):
+    """Lee un archivo de laberinto y retorna (grid, start, end)."""
+    with open(path, "r", encoding="utf-8") as f:
+        return parse_maze(f.read())
+
+def find_points(rows):
+    """Busca y retorna las coordenadas (fila, columna) de 'A' y 'B' en filas de símbolos (None si falta)."""
+    start = end = None
+    for r, row in enumerate(rows):
+        for c, symbol in enumerate(row):
+            if symbol == "A":
+                start = (r, c)
+            elif symbol == "B":
+                end = (r, c)
+    return start, end
+
+def find_path(rows, start, end, algorithm="A*"):
+    """
+    Camino de menor costo en filas de símbolos entre las coordenadas (fila, columna) `start`
+    y `end`. Retorna la lista de coordenadas (inicio -> fin), vacía si no hay camino.
+    """
+    grid, _, _ = grid_from_rows(rows)
+    result = ALGORITHMS[algorithm](grid, grid[start[0]][start[1]], grid[end[0]][end[1]])
+    return [(cell.row, cell.col) for cell in result.path]
+
+def random_grid(rows, cols, wall_prob=0.25, max_cost=9, seed=None):
+    """
+    Genera una cuadrícula aleatoria con paredes y costos de terreno entre 1 y max_cost,
+    con el inicio en la esquina superior izquierda y el fin en la inferior derecha.
+    Retorna (grid, start, end).
+    """
+    rng = random.Random(seed)
+    grid = create_grid(rows, cols)
+    for row in grid:
+        for cell in row:
+            if rng.random() < wall_prob:
+                cell.is_wall = True
+                cell.color = "black"
+            else:
+                cell.cost = rng.randint(1, max_cost)
+    start, end = grid[0][0], grid[rows - 1][cols - 1]
+    for cell in (start, end):
+        cell.is_wall = False
+    start.is_start = end.is_end = True
+    start.color, end.color = "green", "red"
+    return grid, start, end
+
+# --- 6. Copias de la Cuadrícula para Otros Procesos ---
+def snapshot_grid(grid, start, end):
+    """
+    Copia la cuadrícula en datos simples (tuplas y conjuntos) que se pueden enviar a otro
+    proceso: (filas, columnas, paredes, costos distintos de 1, inicio, fin).
+    """
+    walls = frozenset((cell.row, cell.col) for row in grid for cell in row if cell.is_wall)
+    costs = {(cell.row, cell.col): cell.cost for row in grid for cell in row if cell.cost != 1}
+    return (len(grid), len(grid[0]), walls, costs, (start.row, start.col), (end.row, end.col))
+
+def grid_from_snapshot(snapshot):
+    """Reconstruye (grid, start, end) a partir de snapshot_grid."""
+    rows, cols, walls, costs, (sr, sc), (er, ec) = snapshot
+    grid = create_grid(rows, cols)
+    for r, c in walls:
+        grid[r][c].is_wall = True
+    for (r, c), cost in costs.items():
+        grid[r][c].cost = cost
+    grid[sr][sc].is_start = True
+    grid[er][ec].is_end = True
+    return grid, grid[sr][sc], grid[er][ec]
+
+def solve_snapshot(snapshot, name):
+    """
+    Resuelve una copia de la cuadrícula con el algoritmo `name` (pensado para ejecutarse en otro proceso).
+    Retorna (SearchResult con el camino como coordenadas (fila, columna), segundos empleados).
+    """
+    grid, start, end = grid_from_snapshot(snapshot)
+    t0 = time.perf_counter()
+    result = ALGORITHMS[name](grid, start, end)
+    elapsed = time.perf_counter() - t0
+    path = [(cell.row, cell.col) for cell in result.path]
+    return result._replace(path=path), elapsed
+
+# --- 7. Línea de Comandos ---
+def main(argv=None):
+    """Resuelve en lote los laberintos indicados e imprime las estadísticas de cada algoritmo."""
+    parser = argparse.ArgumentParser(description="Resuelve laberintos con A*, Dijkstra, Dial y BFS.")
+    parser.add_argument("laberintos", nargs="*", help="archivos de laberinto (1 = pared, 0 = camino, 2-9 = costo, A/B)")
+    parser.add_argument("--aleatorio", metavar="FILASxCOLUMNAS",
+                        help="además, resolver una cuadrícula aleatoria con costos (por ejemplo 300x300)")
+    parser.add_argument("--semilla", type=int, default=0, help="semilla de la cuadrícula aleatoria")
+    parser.add_argument("-a", "--algoritmos", nargs="+", choices=list(ALGORITHMS), default=list(ALGORITHMS),
+                        help="algoritmos a ejecutar (por defecto todos)")
+    parser.add_argument("-r", "--repeticiones", type=int, default=1,
+                        help="repeticiones para medir el tiempo (se reporta el mejor)")
+    args = parser.parse_args(argv)
+    if not args.laberintos and not args.aleatorio:
+        parser.error("indica al menos un laberinto o --aleatorio")
+
+    mazes = [(path, lambda path=path: load_maze(path)) for path in args.laberintos]
+    if args.aleatorio:
+        try:
+            rows, cols = (int(n) for n in args.aleatorio.lower().split("x"))
+        except ValueError:
+            parser.error("--aleatorio debe tener la forma FILASxCOLUMNAS, por ejemplo 300x300")
+        mazes.append((f"aleatorio {args.aleatorio} (semilla {args.semilla})",
+                      lambda: random_grid(rows, cols, seed=args.semilla)))
+
+    errors = 0
+    for name_maze, load in mazes:
+        try:
+            grid, start, end = load()
+        except (OSError, ValueError) as e:
+            print(f"{name_maze}: error: {e}", file=sys.stderr)
+            errors += 1
+            continue
+
+        print(f"{name_maze} ({len(grid)}x{len(grid[0])})")
+        for name in args.algoritmos:
+            best = float("inf")
+            for _ in range(max(1, args.repeticiones)):
+                t0 = time.perf_counter()
+                result = ALGORITHMS[name](grid, start, end)
+                best = min(best, time.perf_counter() - t0)
+            if result.path:
+                stats = (f"Nodos Explorados: {result.explored}, Pasos del Camino: {result.steps}, "
+                         f"Costo: {result.cost}")
+            else:
+                stats = f"Nodos Explorados: {result.explored}, sin camino"
+            print(f"  {name}: {stats}, Tiempo: {best * 1000:.3f} ms")
+    return 1 if errors else 0
+
+if __name__ == "__main__":
+    sys.exit(main())